@@ -24,6 +24,16 @@ cp -r ../src "$APPDIR/usr/share/creative-suite/"
 cp -r ../assets "$APPDIR/usr/share/creative-suite/"
 cp requirements.txt "$APPDIR/usr/share/creative-suite/"
 
+# Pre-bake the 32x32 app icons into a binary Qt resource (optional, needs rcc)
+RCC="$(command -v rcc || command -v /usr/lib/qt5/bin/rcc || true)"
+if [ -n "$RCC" ]; then
+  python3 generate_icon_qrc.py ../assets/icons/app-icons/32x32 icons.qrc
+  "$RCC" -binary icons.qrc -o "$APPDIR/usr/share/creative-suite/assets/icons.rcc"
+  rm -f icons.qrc
+else
+  echo "rcc not found; app icons will be loaded from the filesystem"
+fi
+
 # Download appimagetool if missing
 if [ ! -f appimagetool ]; then
   wget https://github.com/AppImage/AppImageKit/releases/latest/download/appimagetool-x86_64.AppImage
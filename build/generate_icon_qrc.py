@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Linux Bundle Installer - Icon Resource Generator
+Copyright (c) 2025 Loading Screen Solutions
+
+Licensed under the MIT License. See LICENSE file for details.
+
+Writes a Qt resource file (.qrc) that maps every 32x32 app icon to
+:/creative-suite/icons/<app_id>.png. build_appimage.sh compiles it with
+`rcc -binary` into assets/icons.rcc, which main.py registers at startup.
+
+Usage: generate_icon_qrc.py <icons_32x32_dir> <output.qrc>
+"""
+
+import os
+import sys
+from xml.sax.saxutils import escape
+
+ICON_PREFIX = "creative-suite-"
+
+def main(argv):
+    if len(argv) != 3:
+        print(f"Usage: {argv[0]} <icons_32x32_dir> <output.qrc>")
+        return 1
+
+    icons_dir = os.path.abspath(argv[1])
+    output = argv[2]
+
+    # Only the shipped creative-suite-<app_id>.png icons, not test- variants
+    entries = sorted(
+        entry.name for entry in os.scandir(icons_dir)
+        if entry.name.startswith(ICON_PREFIX) and entry.name.endswith(".png")
+    )
+
+    lines = ['<!DOCTYPE RCC><RCC version="1.0">', '<qresource prefix="/creative-suite/icons">']
+    for name in entries:
+        alias = name[len(ICON_PREFIX):]
+        path = os.path.join(icons_dir, name)
+        lines.append(f'  <file alias="{escape(alias)}">{escape(path)}</file>')
+    lines.append('</qresource>')
+    lines.append('</RCC>')
+
+    with open(output, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+    print(f"Wrote {len(entries)} icons to {output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
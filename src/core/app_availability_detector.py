@@ -9,14 +9,50 @@ Author: James T. Miller
 Created: 2025-06-05
 """
 
+import os
+import sys
+import stat
+import json
+import asyncio
+import logging
+import functools
 import subprocess
 import shutil
 import time
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict, replace
 from pathlib import Path
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+DPKG_STATUS_FILE = Path('/var/lib/dpkg/status')
+
+FLATPAK_LIST_CMD = ['flatpak', 'list', '--app', '--columns=application,version']
+SNAP_LIST_CMD = ['snap', 'list']
+
+# Paths whose mtimes change whenever apt, Flatpak or Snap install/remove something
+PACKAGE_STATE_PATHS = [
+    DPKG_STATUS_FILE,
+    Path('/var/lib/flatpak/app'),
+    Path.home() / '.local' / 'share' / 'flatpak' / 'app',
+    Path('/var/lib/snapd/snaps'),
+]
+
+# Parsed dpkg status shared across detector instances: (mtime_ns, index)
+_dpkg_status_cache = None
+
+# Shared detector for the convenience functions, created on first use
+_DEFAULT_DETECTOR = None
+
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> Optional[str]:
+    """shutil.which, cached for the lifetime of the process"""
+    return shutil.which(name)
+
+# dataclass(slots=True) needs Python 3.10; older interpreters keep the instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class AppAvailability:
     """Represents the availability status of an application"""
     app_id: str
@@ -44,21 +80,93 @@ class AppAvailabilityDetector:
     Focus on apt/dpkg first, expand to other managers later.
     """
     
+    _cache_path = Path.home() / '.cache' / 'creative-suite' / 'availability.json'
+    
     def __init__(self):
         self.cache = {}
-        self.cache_timestamp = 0
-        self.cache_duration = 300  # 5 minutes
+        # Package state and PATH mtimes the cache was built against; any change invalidates it
+        self._cache_mtimes = self._current_mtimes()
+        
+        # Batched dpkg-query results for the current scan: {package: (installed, version)}
+        self._apt_prefetch = {}
+        
+        # Parsed /var/lib/dpkg/status: {package: (installed, version)}
+        self._dpkg_index = None
+        
+        # Installed Flatpak/Snap apps, loaded once per scan: {id: version}
+        self._flatpak_index = None
+        self._snap_index = None
+        
+        # Executables on PATH: {name: full_path}
+        self._path_index = None
+        
+        # Package names/ids from the app definitions: {(app_id, manager): packages}
+        self._pkg_cache: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+        # Parser the memo was filled from; an edited definitions file gives a new one
+        self._pkg_parser = None
+        
+        # Whether the apps in the current scan define any Flatpak/Snap ids at all
+        self._any_flatpak = True
+        self._any_snap = True
         
         # Check what package managers are available
-        self.has_apt = shutil.which('apt') is not None and shutil.which('dpkg') is not None
-        self.has_flatpak = shutil.which('flatpak') is not None
-        self.has_snap = shutil.which('snap') is not None
+        self.has_apt = _which('apt') is not None and _which('dpkg') is not None
+        self.has_flatpak = _which('flatpak') is not None
+        self.has_snap = _which('snap') is not None
+        
+        logger.debug("Available package managers - apt: %s, flatpak: %s, snap: %s",
+                     self.has_apt, self.has_flatpak, self.has_snap)
+        
+        # Reuse results from a previous run if no package manager state changed since
+        self._load_persistent_cache()
+    
+    def _current_mtimes(self) -> Dict[str, Optional[int]]:
+        """
+        Get the mtimes of the package manager state paths and the PATH
+        directories (None if missing); executable results depend on the latter
+        """
+        paths = [str(path) for path in PACKAGE_STATE_PATHS]
+        paths += [d for d in os.environ.get('PATH', os.defpath).split(os.pathsep) if d]
         
-        print(f"DEBUG: Available package managers - apt: {self.has_apt}, flatpak: {self.has_flatpak}, snap: {self.has_snap}")
+        mtimes = {}
+        for path in paths:
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                mtimes[path] = None
+        return mtimes
+    
+    def _load_persistent_cache(self):
+        """Load the on-disk availability cache if it is still consistent with the system"""
+        try:
+            payload = json.loads(self._cache_path.read_text(encoding='utf-8'))
+            if payload.get('mtimes') != self._cache_mtimes:
+                logger.debug("Persistent availability cache is stale")
+                return
+            self.cache = {
+                app_id: AppAvailability(**availability)
+                for app_id, availability in payload.get('apps', {}).items()
+            }
+            logger.debug("Loaded %d cached availability results", len(self.cache))
+        except (OSError, ValueError, TypeError, AttributeError):
+            # Missing or corrupt cache file - just scan again
+            self.cache = {}
+    
+    def _save_persistent_cache(self):
+        """Write the availability cache to disk together with the current mtimes"""
+        payload = {
+            'mtimes': self._cache_mtimes,
+            'apps': {app_id: asdict(availability) for app_id, availability in self.cache.items()}
+        }
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._cache_path.write_text(json.dumps(payload), encoding='utf-8')
+        except OSError as e:
+            logger.warning("Could not write availability cache: %s", e)
     
     def _is_cache_valid(self) -> bool:
-        """Check if cache is still valid"""
-        return (time.time() - self.cache_timestamp) < self.cache_duration
+        """Check if cache is still valid (no apt/Flatpak/Snap or PATH changes since it was built)"""
+        return bool(self.cache) and self._current_mtimes() == self._cache_mtimes
     
     def _run_command(self, cmd: List[str], timeout: int = 5) -> Tuple[bool, str, str]:
         """
@@ -78,6 +186,112 @@ class AppAvailabilityDetector:
         except Exception as e:
             return False, "", str(e)
     
+    def _prefetch_apt_packages(self, packages: List[str]) -> Dict[str, Tuple[bool, Optional[str]]]:
+        """
+        Query the status of many apt packages with a single dpkg-query call
+        Returns: {package_name: (is_installed, version_info)}
+        """
+        if not self.has_apt or not packages:
+            return {}
+        
+        # Every queried package gets an entry; unknown packages stay "not installed"
+        prefetch = {package: (False, None) for package in packages}
+        
+        # dpkg-query exits non-zero when any package is unknown, but still
+        # reports the ones it knows about, so the exit code is ignored here
+        success, stdout, stderr = self._run_command([
+            'dpkg-query', '-W', '-f=${Package}\t${Status}\t${Version}\n', *packages
+        ])
+        
+        for line in stdout.splitlines():
+            parts = line.split('\t')
+            if len(parts) < 3:
+                continue
+            package_name, status, version = parts[0], parts[1], parts[2]
+            # Multi-arch packages are reported as name:arch
+            package_name = package_name.split(':', 1)[0]
+            if status == 'install ok installed':
+                prefetch[package_name] = (True, version or "unknown")
+        
+        return prefetch
+    
+    def _load_dpkg_status(self) -> Optional[Dict[str, Tuple[bool, Optional[str]]]]:
+        """
+        Read the dpkg status database directly instead of spawning dpkg-query
+        Returns: {package_name: (is_installed, version_info)}, or None if unreadable
+        """
+        global _dpkg_status_cache
+        
+        try:
+            mtime_ns = os.stat(DPKG_STATUS_FILE).st_mtime_ns
+        except OSError:
+            self._dpkg_index = None
+            return None
+        
+        # Reuse the previous parse until dpkg rewrites the file
+        if _dpkg_status_cache is not None and _dpkg_status_cache[0] == mtime_ns:
+            self._dpkg_index = _dpkg_status_cache[1]
+            return self._dpkg_index
+        
+        try:
+            with open(DPKG_STATUS_FILE, 'r', encoding='utf-8', errors='replace') as f:
+                content = f.read()
+        except OSError:
+            self._dpkg_index = None
+            return None
+        
+        index = {}
+        for record in content.split('\n\n'):
+            package_name = status = version = None
+            for line in record.split('\n'):
+                if line.startswith('Package: '):
+                    package_name = line[9:].strip()
+                elif line.startswith('Status: '):
+                    status = line[8:].strip()
+                elif line.startswith('Version: '):
+                    version = line[9:].strip()
+            
+            if not package_name:
+                continue
+            
+            # Multi-arch packages have one record per architecture
+            if status == 'install ok installed':
+                index[package_name] = (True, version or "unknown")
+            elif package_name not in index:
+                index[package_name] = (False, None)
+        
+        _dpkg_status_cache = (mtime_ns, index)
+        self._dpkg_index = index
+        return index
+    
+    def _pkgs(self, json_parser, app_id: str, manager: str) -> Tuple[str, ...]:
+        """Memoized json_parser.get_packages_for_manager lookup"""
+        if json_parser is not self._pkg_parser:
+            self._pkg_cache.clear()
+            self._pkg_parser = json_parser
+        
+        key = (app_id, manager)
+        packages = self._pkg_cache.get(key)
+        if packages is None:
+            packages = tuple(json_parser.get_packages_for_manager(app_id, manager))
+            self._pkg_cache[key] = packages
+        return packages
+    
+    def _prefetch_apt_index(self, app_list: List[Dict], json_parser):
+        """
+        Index the dpkg status database once; if it can't be read, fall
+        back to querying all apt packages with one dpkg-query call
+        """
+        if self._load_dpkg_status() is not None:
+            return
+        
+        all_apts = {
+            package
+            for app in app_list if app.get('id')
+            for package in self._pkgs(json_parser, app['id'], 'apt')
+        }
+        self._apt_prefetch = self._prefetch_apt_packages(sorted(all_apts))
+    
     def _check_apt_package(self, package_name: str) -> Tuple[bool, Optional[str]]:
         """
         Check if a package is installed via apt/dpkg
@@ -86,6 +300,46 @@ class AppAvailabilityDetector:
         if not self.has_apt:
             return False, None
         
+        # Prefer the in-process status database index
+        if self._dpkg_index is None:
+            self._load_dpkg_status()
+        if self._dpkg_index is not None:
+            return self._dpkg_index.get(package_name, (False, None))
+        
+        # Use the batched result from detect_multiple_apps when available
+        if package_name in self._apt_prefetch:
+            return self._apt_prefetch[package_name]
+        
+        # Most packages are unknown to dpkg, so rule those out without capturing output
+        if not self._apt_installed(package_name):
+            return False, None
+        
+        version = self._apt_version(package_name)
+        if version is None:
+            return False, None
+        return True, version
+    
+    def _apt_installed(self, package_name: str) -> bool:
+        """
+        Cheap dpkg check using only the exit code
+        A zero exit means dpkg has a record for the package, which may still be
+        a removed package with leftover config files - _apt_version confirms it
+        """
+        try:
+            return subprocess.call(
+                ['dpkg', '-s', package_name],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=5
+            ) == 0
+        except (subprocess.TimeoutExpired, OSError):
+            return False
+    
+    def _apt_version(self, package_name: str) -> Optional[str]:
+        """
+        Get the installed version of an apt package
+        Returns: version string, or None if the package is not fully installed
+        """
         # Use dpkg-query for precise package status
         success, stdout, stderr = self._run_command([
             'dpkg-query', '-W', '-f=${Status} ${Version}', package_name
@@ -94,10 +348,81 @@ class AppAvailabilityDetector:
         if success and 'install ok installed' in stdout:
             # Extract version from output
             parts = stdout.strip().split()
-            version = parts[-1] if len(parts) > 3 else "unknown"
-            return True, version
+            return parts[-1] if len(parts) > 3 else "unknown"
         
-        return False, None
+        return None
+    
+    async def _run_async(self, cmd: List[str], timeout: int = 5) -> Tuple[bool, str, str]:
+        """
+        Async counterpart of _run_command for use inside the scan event loop
+        Returns: (success, stdout, stderr)
+        """
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except Exception as e:
+            # e.g. no child watcher for this thread's loop; the blocking
+            # path may still work, so don't report the app as missing yet
+            logger.warning("Could not start %s asynchronously (%s); running it synchronously", cmd[0], e)
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(None, self._run_command, cmd, timeout)
+        
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return False, "", "Command timed out"
+        
+        return (
+            proc.returncode == 0,
+            stdout.decode('utf-8', errors='replace'),
+            stderr.decode('utf-8', errors='replace')
+        )
+    
+    def _parse_flatpak_list(self, stdout: str) -> Dict[str, str]:
+        """Parse 'flatpak list --columns=application,version' output into {application_id: version}"""
+        flatpak_index = {}
+        for line in stdout.splitlines():
+            app_id, _, version = line.strip().partition('\t')
+            if app_id:
+                flatpak_index[app_id] = version or "unknown"
+        return flatpak_index
+    
+    def _parse_snap_list(self, stdout: str) -> Dict[str, str]:
+        """Parse 'snap list' output into {snap_name: version}"""
+        snap_index = {}
+        lines = iter(stdout.splitlines())
+        next(lines, None)  # Skip header
+        for line in lines:
+            parts = line.split()
+            if parts:
+                version = parts[1] if len(parts) > 1 else "unknown"
+                snap_index[parts[0]] = version
+        return snap_index
+    
+    def _load_flatpak_index(self):
+        """Build the {application_id: version} index from a single flatpak list call"""
+        success, stdout, stderr = self._run_command(FLATPAK_LIST_CMD)
+        self._flatpak_index = self._parse_flatpak_list(stdout) if success else {}
+    
+    def _load_snap_index(self):
+        """Build the {snap_name: version} index from a single snap list call"""
+        success, stdout, stderr = self._run_command(SNAP_LIST_CMD)
+        self._snap_index = self._parse_snap_list(stdout) if success else {}
+    
+    async def _load_flatpak_index_async(self):
+        """Async version of _load_flatpak_index"""
+        success, stdout, stderr = await self._run_async(FLATPAK_LIST_CMD)
+        self._flatpak_index = self._parse_flatpak_list(stdout) if success else {}
+    
+    async def _load_snap_index_async(self):
+        """Async version of _load_snap_index"""
+        success, stdout, stderr = await self._run_async(SNAP_LIST_CMD)
+        self._snap_index = self._parse_snap_list(stdout) if success else {}
     
     def _check_flatpak_app(self, flatpak_id: str) -> Tuple[bool, Optional[str]]:
         """
@@ -107,18 +432,10 @@ class AppAvailabilityDetector:
         if not self.has_flatpak or not flatpak_id:
             return False, None
         
-        success, stdout, stderr = self._run_command([
-            'flatpak', 'list', '--app', '--columns=application,version'
-        ])
+        if self._flatpak_index is None:
+            self._load_flatpak_index()
         
-        if success:
-            for line in stdout.split('\n'):
-                if flatpak_id in line:
-                    parts = line.strip().split('\t')
-                    version = parts[1] if len(parts) > 1 else "unknown"
-                    return True, version
-        
-        return False, None
+        return flatpak_id in self._flatpak_index, self._flatpak_index.get(flatpak_id)
     
     def _check_snap_app(self, snap_name: str) -> Tuple[bool, Optional[str]]:
         """
@@ -128,57 +445,169 @@ class AppAvailabilityDetector:
         if not self.has_snap or not snap_name:
             return False, None
         
-        success, stdout, stderr = self._run_command([
-            'snap', 'list', snap_name
-        ])
+        if self._snap_index is None:
+            self._load_snap_index()
         
-        if success:
-            lines = stdout.strip().split('\n')
-            if len(lines) > 1:  # Header + data
-                parts = lines[1].split()
-                version = parts[1] if len(parts) > 1 else "unknown"
-                return True, version
+        return snap_name in self._snap_index, self._snap_index.get(snap_name)
+    
+    def _build_path_index(self) -> Dict[str, str]:
+        """
+        Index every executable on PATH with one directory listing per PATH entry
+        Returns: {executable_name: full_path}
+        """
+        path_index = {}
         
-        return False, None
+        for directory in os.environ.get('PATH', os.defpath).split(os.pathsep):
+            if not directory:
+                continue
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        # First match wins, matching PATH lookup order
+                        if entry.name in path_index:
+                            continue
+                        try:
+                            # DirEntry caches the stat result; symlinks (common in
+                            # /usr/bin) need one extra stat to check their target
+                            st = entry.stat(follow_symlinks=False)
+                            if stat.S_ISLNK(st.st_mode):
+                                st = entry.stat()
+                            if stat.S_ISREG(st.st_mode) and st.st_mode & 0o111:
+                                path_index[entry.name] = entry.path
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        
+        return path_index
     
     def _check_executable(self, app_id: str) -> Tuple[bool, Optional[str]]:
         """
         Check if executable is available in PATH
         Returns: (is_available, executable_path)
         """
-        executable_path = shutil.which(app_id)
+        if self._path_index is None:
+            self._path_index = self._build_path_index()
+        
+        executable_path = self._path_index.get(app_id)
         if executable_path:
             return True, executable_path
         
-        # Try some common variations
-        common_variations = [
+        # Try some common variations (ordered, without duplicates or the original id)
+        common_variations = dict.fromkeys((
             app_id.lower(),
             app_id.replace('-', ''),
             app_id.replace('_', ''),
-        ]
+        ))
+        common_variations.pop(app_id, None)
         
         for variation in common_variations:
-            path = shutil.which(variation)
+            path = self._path_index.get(variation)
             if path:
                 return True, path
         
         return False, None
     
+    def _detect_executable(self, app_id: str, app_name: str) -> Optional[AppAvailability]:
+        """Build an 'executable' availability result if the app is on PATH"""
+        is_available, executable_path = self._check_executable(app_id)
+        if not is_available:
+            return None
+        
+        logger.debug("%s found as executable: %s", app_name, executable_path)
+        return AppAvailability(
+            app_id=app_id,
+            app_name=app_name,
+            is_available=True,
+            installation_method='executable',
+            executable_path=executable_path
+        )
+    
+    def _add_package_details(self, availability: AppAvailability, json_parser) -> AppAvailability:
+        """
+        Fill in the package behind an executable hit from the apt/Flatpak/Snap
+        indexes already loaded for this scan, without running any new queries
+        """
+        app_id = availability.app_id
+        
+        # Reading the dpkg status file is in-process and shared, so allow that
+        if self.has_apt and self._dpkg_index is None:
+            self._load_dpkg_status()
+        for package_name in self._pkgs(json_parser, app_id, 'apt'):
+            if self._dpkg_index is not None:
+                is_installed, version = self._dpkg_index.get(package_name, (False, None))
+            else:
+                is_installed, version = self._apt_prefetch.get(package_name, (False, None))
+            if is_installed:
+                return replace(availability, installation_method='apt',
+                               package_name=package_name, version_info=version)
+        
+        if self._flatpak_index:
+            for flatpak_id in self._pkgs(json_parser, app_id, 'flatpak'):
+                if flatpak_id in self._flatpak_index:
+                    return replace(availability, installation_method='flatpak', package_name=flatpak_id,
+                                   version_info=self._flatpak_index[flatpak_id])
+        
+        if self._snap_index:
+            for snap_name in self._pkgs(json_parser, app_id, 'snap'):
+                if snap_name in self._snap_index:
+                    return replace(availability, installation_method='snap', package_name=snap_name,
+                                   version_info=self._snap_index[snap_name])
+        
+        return availability
+    
+    def _drop_stale_cache(self):
+        """Clear cached results and indexes if apt/Flatpak/Snap state or PATH changed since they were built"""
+        mtimes = self._current_mtimes()
+        if mtimes == self._cache_mtimes:
+            return
+        
+        self.cache.clear()
+        self._cache_mtimes = mtimes
+        self._apt_prefetch = {}
+        self._dpkg_index = None
+        self._flatpak_index = None
+        self._snap_index = None
+        self._path_index = None
+    
     def detect_app_availability(self, app_data: Dict, json_parser) -> AppAvailability:
         """
         Detect availability of a single application using multiple methods
+        Results are cached, including "not installed", until package state or
+        a PATH directory changes
         """
         app_id = app_data.get('id', 'unknown')
+        
+        # Also resets the PATH and package indexes a fresh probe would use
+        self._drop_stale_cache()
+        if app_id in self.cache:
+            return self.cache[app_id]
+        
+        availability = self._probe_app(app_data, json_parser)
+        self.cache[app_id] = availability
+        return availability
+    
+    def _probe_app(self, app_data: Dict, json_parser) -> AppAvailability:
+        """Run the detection methods for a single application, bypassing the cache"""
+        app_id = app_data.get('id', 'unknown')
         app_name = app_data.get('name', app_id)
         
-        print(f"DEBUG: Detecting availability for {app_name} ({app_id})")
+        logger.debug("Detecting availability for %s (%s)", app_name, app_id)
+        
+        # Apps whose binary is normally on PATH can opt in to the cheap PATH
+        # lookup first; the package manager checks below remain as fallbacks.
+        # A hit still reports the package and version the loaded indexes know of
+        prefer_executable = app_data.get('prefer_executable_check', False)
+        if prefer_executable:
+            availability = self._detect_executable(app_id, app_name)
+            if availability:
+                return self._add_package_details(availability, json_parser)
         
         # Method 1: Check apt packages (primary method for Mint)
-        apt_packages = json_parser.get_packages_for_manager(app_id, 'apt')
-        for package_name in apt_packages:
+        for package_name in self._pkgs(json_parser, app_id, 'apt'):
             is_installed, version = self._check_apt_package(package_name)
             if is_installed:
-                print(f"DEBUG: {app_name} found via apt package: {package_name}")
+                logger.debug("%s found via apt package: %s", app_name, package_name)
                 return AppAvailability(
                     app_id=app_id,
                     app_name=app_name,
@@ -189,12 +618,11 @@ class AppAvailabilityDetector:
                 )
         
         # Method 2: Check Flatpak (if available)
-        if self.has_flatpak:
-            flatpak_id = json_parser.get_flatpak_id(app_id)
-            if flatpak_id:
+        if self.has_flatpak and self._any_flatpak:
+            for flatpak_id in self._pkgs(json_parser, app_id, 'flatpak'):
                 is_installed, version = self._check_flatpak_app(flatpak_id)
                 if is_installed:
-                    print(f"DEBUG: {app_name} found via Flatpak: {flatpak_id}")
+                    logger.debug("%s found via Flatpak: %s", app_name, flatpak_id)
                     return AppAvailability(
                         app_id=app_id,
                         app_name=app_name,
@@ -205,12 +633,11 @@ class AppAvailabilityDetector:
                     )
         
         # Method 3: Check Snap (if available)
-        if self.has_snap:
-            snap_name = json_parser.get_snap_id(app_id)
-            if snap_name:
+        if self.has_snap and self._any_snap:
+            for snap_name in self._pkgs(json_parser, app_id, 'snap'):
                 is_installed, version = self._check_snap_app(snap_name)
                 if is_installed:
-                    print(f"DEBUG: {app_name} found via Snap: {snap_name}")
+                    logger.debug("%s found via Snap: %s", app_name, snap_name)
                     return AppAvailability(
                         app_id=app_id,
                         app_name=app_name,
@@ -221,19 +648,13 @@ class AppAvailabilityDetector:
                     )
         
         # Method 4: Check executable in PATH (fallback)
-        is_available, executable_path = self._check_executable(app_id)
-        if is_available:
-            print(f"DEBUG: {app_name} found as executable: {executable_path}")
-            return AppAvailability(
-                app_id=app_id,
-                app_name=app_name,
-                is_available=True,
-                installation_method='executable',
-                executable_path=executable_path
-            )
+        if not prefer_executable:
+            availability = self._detect_executable(app_id, app_name)
+            if availability:
+                return availability
         
         # Not found anywhere
-        print(f"DEBUG: {app_name} not found via any method")
+        logger.debug("%s not found via any method", app_name)
         return AppAvailability(
             app_id=app_id,
             app_name=app_name,
@@ -246,9 +667,13 @@ class AppAvailabilityDetector:
         Detect availability for multiple applications
         Uses caching to avoid repeated scans
         """
+        return asyncio.run(self._detect_multiple_async(app_list, json_parser))
+    
+    async def _detect_multiple_async(self, app_list: List[Dict], json_parser) -> Dict[str, AppAvailability]:
+        """Async core of detect_multiple_apps"""
         # Check cache first
-        if self._is_cache_valid() and self.cache:
-            print("DEBUG: Using cached availability results")
+        if self._is_cache_valid():
+            logger.debug("Using cached availability results")
             # Filter cache for requested apps
             requested_ids = {app.get('id') for app in app_list}
             cached_results = {
@@ -261,30 +686,67 @@ class AppAvailabilityDetector:
             if len(cached_results) == len(app_list):
                 return cached_results
         
-        print(f"DEBUG: Scanning availability for {len(app_list)} applications...")
+        logger.debug("Scanning availability for %d applications...", len(app_list))
         start_time = time.time()
         
-        results = {}
-        for app_data in app_list:
-            app_id = app_data.get('id')
-            if app_id:
-                availability = self.detect_app_availability(app_data, json_parser)
-                results[app_id] = availability
+        # Record package state before scanning so changes made mid-scan invalidate the results
+        self._drop_stale_cache()
+        
+        # Skip Flatpak/Snap entirely when no app in this scan has an id for them
+        self._any_flatpak = any(self._pkgs(json_parser, app['id'], 'flatpak') for app in app_list if app.get('id'))
+        self._any_snap = any(self._pkgs(json_parser, app['id'], 'snap') for app in app_list if app.get('id'))
+        
+        try:
+            # Refresh the apt/Flatpak/Snap indexes once for the whole scan.
+            # They are independent and I/O bound, so run them concurrently.
+            prefetch_tasks = []
+            if self.has_apt:
+                # Reading the dpkg status file is blocking file I/O, so give it a thread
+                loop = asyncio.get_event_loop()
+                prefetch_tasks.append(loop.run_in_executor(None, self._prefetch_apt_index, app_list, json_parser))
+            if self.has_flatpak and self._any_flatpak:
+                prefetch_tasks.append(self._load_flatpak_index_async())
+            if self.has_snap and self._any_snap:
+                prefetch_tasks.append(self._load_snap_index_async())
+            await asyncio.gather(*prefetch_tasks)
+            
+            results = {}
+            for app_data in app_list:
+                app_id = app_data.get('id')
+                if app_id:
+                    # Cache entries still present were validated above
+                    availability = self.cache.get(app_id) or self._probe_app(app_data, json_parser)
+                    results[app_id] = availability
+        finally:
+            # Single-app lookups outside a scan must not inherit this scan's shortcut
+            self._any_flatpak = True
+            self._any_snap = True
         
         # Update cache
         self.cache.update(results)
-        self.cache_timestamp = time.time()
+        self._save_persistent_cache()
         
         scan_time = time.time() - start_time
-        print(f"DEBUG: Availability scan completed in {scan_time:.2f} seconds")
+        logger.debug("Availability scan completed in %.2f seconds", scan_time)
         
         return results
     
     def invalidate_cache(self):
         """Invalidate the availability cache (call after installing/removing apps)"""
-        print("DEBUG: Invalidating availability cache")
+        logger.debug("Invalidating availability cache")
         self.cache.clear()
-        self.cache_timestamp = 0
+        self._pkg_cache.clear()
+        self._pkg_parser = None
+        self._apt_prefetch = {}
+        self._dpkg_index = None
+        self._flatpak_index = None
+        self._snap_index = None
+        self._path_index = None
+        
+        try:
+            self._cache_path.unlink()
+        except OSError:
+            pass
     
     def get_system_summary(self) -> Dict[str, any]:
         """Get summary of system package manager availability"""
@@ -299,12 +761,19 @@ class AppAvailabilityDetector:
         }
 
 # Convenience functions for easy integration
+def _get_default_detector() -> AppAvailabilityDetector:
+    """Get the shared detector so its caches survive across convenience calls"""
+    global _DEFAULT_DETECTOR
+    if _DEFAULT_DETECTOR is None:
+        _DEFAULT_DETECTOR = AppAvailabilityDetector()
+    return _DEFAULT_DETECTOR
+
 def detect_app_availability(app_data: Dict, json_parser) -> AppAvailability:
     """Standalone function to detect single app availability"""
-    detector = AppAvailabilityDetector()
+    detector = _get_default_detector()
     return detector.detect_app_availability(app_data, json_parser)
 
 def detect_multiple_apps_availability(app_list: List[Dict], json_parser) -> Dict[str, AppAvailability]:
     """Standalone function to detect multiple apps availability"""
-    detector = AppAvailabilityDetector()
+    detector = _get_default_detector()
     return detector.detect_multiple_apps(app_list, json_parser)
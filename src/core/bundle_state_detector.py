@@ -10,12 +10,24 @@ Created: 2025-06-01
 Enhanced: 2025-06-05
 """
 
-from pathlib import Path
-from typing import List, Dict, Optional
+import os
+import logging
+from typing import FrozenSet, Iterator, List, Dict, Optional, Set, Tuple
 
 # Import our new availability detector
 from core.app_availability_detector import AppAvailabilityDetector, AppAvailability
 
+logger = logging.getLogger(__name__)
+
+# BUNDLE_STATE_DEBUG=1 prints this module's debug messages to stderr
+_DEBUG = os.environ.get("BUNDLE_STATE_DEBUG") == "1"
+if _DEBUG:
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(logging.StreamHandler())
+
+# Bundle desktop/icon ids that belong to the suite itself, not to an app
+_RESERVED_IDS = frozenset(("manager", "main"))
+
 class BundleStateDetector:
     """
     Detect bundle installation state by checking for desktop files
@@ -25,17 +37,41 @@ class BundleStateDetector:
     the bundle is installed. Additionally, verify that target apps are actually available.
     """
     
+    __slots__ = (
+        'config', 'desktop_dir', 'icons_dir', 'bundle_prefix',
+        '_desktop_dir_str', '_icons_dir_str', '_file_prefix',
+        '_scan_cache', '_scan_mtimes', '_installed_set',
+        '_availability_detector',
+    )
+    
     def __init__(self, config):
         self.config = config
         self.desktop_dir = config.user_applications_dir
         self.icons_dir = config.user_icons_dir
         self.bundle_prefix = self._get_bundle_prefix()
         
-        # Initialize availability detector
-        self.availability_detector = AppAvailabilityDetector()
+        # String forms used by the scandir/stat helpers, built once
+        self._desktop_dir_str = str(self.desktop_dir)
+        self._icons_dir_str = str(self.icons_dir)
+        self._file_prefix = f"{self.bundle_prefix}-"
         
-        print(f"DEBUG: BundleStateDetector initialized with prefix: {self.bundle_prefix}")
-        print(f"DEBUG: Looking in desktop dir: {self.desktop_dir}")
+        # Last (desktop_ids, icon_ids) scan and the directory mtimes it was taken at
+        self._scan_cache = None
+        self._scan_mtimes = None
+        # Installed app ids derived from the current scan
+        self._installed_set = None
+        # Created on first use by the availability_detector property
+        self._availability_detector = None
+        
+        logger.debug("BundleStateDetector initialized with prefix: %s", self.bundle_prefix)
+        logger.debug("Looking in desktop dir: %s", self.desktop_dir)
+    
+    @property
+    def availability_detector(self) -> AppAvailabilityDetector:
+        """Availability detector, created on first use (plain state queries never need it)"""
+        if self._availability_detector is None:
+            self._availability_detector = AppAvailabilityDetector()
+        return self._availability_detector
     
     def _get_bundle_prefix(self) -> str:
         """
@@ -45,6 +81,63 @@ class BundleStateDetector:
         # Don't try to derive from JSON, just use the fixed prefix
         return 'creative-suite'
     
+    def _iter_bundle_files(self, directory: str, suffix: str) -> Iterator[Tuple[str, os.DirEntry]]:
+        """
+        Yield (app_id, entry) for each '<prefix>-<app_id><suffix>' file in
+        directory; a missing or unreadable directory yields nothing
+        """
+        prefix = self._file_prefix
+        start, end = len(prefix), -len(suffix)
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith(prefix) and name.endswith(suffix):
+                        yield name[start:end], entry
+        except OSError:
+            return
+    
+    def _scan_ids(self, directory: str, suffix: str) -> Set[str]:
+        """App ids of the bundle files in directory"""
+        return {app_id for app_id, _ in self._iter_bundle_files(directory, suffix)}
+    
+    @staticmethod
+    def _dir_mtime(directory: str) -> Optional[int]:
+        """Directory mtime in ns (changes when entries are added or removed)"""
+        try:
+            return os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+    
+    def _scan(self) -> Tuple[Set[str], Set[str]]:
+        """
+        Bundle app ids that have desktop files and icons, reading each
+        directory once; reused while neither directory's mtime changes
+        or until refresh()
+        """
+        mtimes = (self._dir_mtime(self._desktop_dir_str), self._dir_mtime(self._icons_dir_str))
+        if self._scan_cache is None or mtimes != self._scan_mtimes:
+            self._scan_cache = (
+                self._scan_ids(self._desktop_dir_str, '.desktop'),
+                self._scan_ids(self._icons_dir_str, '.png'),
+            )
+            self._scan_mtimes = mtimes
+            self._installed_set = None
+        return self._scan_cache
+    
+    def refresh(self):
+        """Forget the cached directory scan (call after changing bundle files)"""
+        self._scan_cache = None
+        self._installed_set = None
+    
+    def _get_installed_set(self) -> FrozenSet[str]:
+        """Installed bundle app ids for membership tests and set arithmetic"""
+        desktop_ids, _ = self._scan()
+        if self._installed_set is None:
+            # creative-suite-gimp.desktop → gimp; skip the manager desktop file
+            self._installed_set = frozenset(desktop_ids - _RESERVED_IDS)
+        return self._installed_set
+    
     def get_installed_bundle_apps(self) -> List[str]:
         """
         Get list of app IDs that have bundle desktop files
@@ -52,69 +145,54 @@ class BundleStateDetector:
         Returns:
             List of app IDs (e.g., ['gimp', 'inkscape', 'audacity'])
         """
-        installed_apps = []
-        
-        if not self.desktop_dir.exists():
-            print(f"DEBUG: Desktop directory doesn't exist: {self.desktop_dir}")
-            return installed_apps
-        
-        # Look for our specific desktop files
-        pattern = f"{self.bundle_prefix}-*.desktop"
-        print(f"DEBUG: Looking for pattern: {pattern}")
-        
-        found_files = list(self.desktop_dir.glob(pattern))
-        print(f"DEBUG: Found desktop files: {[f.name for f in found_files]}")
-        
-        for desktop_file in found_files:
-            # Extract app ID from filename
-            # creative-suite-gimp.desktop → gimp
-            filename = desktop_file.stem  # Remove .desktop extension
-            
-            if filename.startswith(f"{self.bundle_prefix}-"):
-                app_id = filename[len(f"{self.bundle_prefix}-"):]
-                
-                # Skip the manager desktop file
-                if app_id not in ["manager", "main"]:
-                    installed_apps.append(app_id)
-                    print(f"DEBUG: Found installed app: {app_id}")
-        
-        print(f"DEBUG: Total installed apps found: {len(installed_apps)}")
-        return sorted(installed_apps)
+        installed_apps = sorted(self._get_installed_set())
+        logger.debug("Found installed apps in %s: %s", self.desktop_dir, installed_apps)
+        return installed_apps
     
     def is_app_installed_by_bundle(self, app_id: str) -> bool:
         """Check if a specific app is installed by this bundle"""
-        desktop_file = self.desktop_dir / f"{self.bundle_prefix}-{app_id}.desktop"
-        exists = desktop_file.exists()
-        print(f"DEBUG: Checking {app_id}: {desktop_file} exists = {exists}")
-        return exists
+        return app_id in self._get_installed_set()
     
     def is_bundle_installed(self) -> bool:
         """Check if bundle has any installed apps"""
         installed_count = len(self.get_installed_bundle_apps())
-        print(f"DEBUG: Bundle installed check: {installed_count} apps found")
+        logger.debug("Bundle installed check: %d apps found", installed_count)
         return installed_count > 0
     
     def is_manager_installed(self) -> bool:
         """Check if the bundle manager is installed"""
-        manager_desktop = self.desktop_dir / f"{self.bundle_prefix}-manager.desktop"
-        return manager_desktop.exists()
+        desktop_ids, _ = self._scan()
+        return "manager" in desktop_ids
     
     def is_category_installed(self) -> bool:
         """Check if the bundle category is installed"""
         category_file = self.config.user_desktop_directories_dir / "X-Creative-Suite.directory"
         return category_file.exists()
     
+    def _installed_state(self) -> Tuple[List[str], bool, bool]:
+        """
+        (installed app ids, manager installed, category installed) from a
+        single directory scan plus one check for the category file
+        """
+        desktop_ids, _ = self._scan()
+        return (
+            sorted(self._get_installed_set()),
+            "manager" in desktop_ids,
+            self.is_category_installed(),
+        )
+    
     def get_bundle_info_with_availability(self, app_parser=None) -> Dict:
         """
         Get complete bundle installation information with availability status
         
         This is the enhanced version that checks actual app availability
         """
-        installed_apps = self.get_installed_bundle_apps()
+        installed_apps, manager_installed, category_installed = self._installed_state()
         
         # Get app names for the installed apps
         app_names = []
         availability_info = {}
+        available_count = 0
         
         if app_parser:
             # Get all apps from JSON to check availability
@@ -132,23 +210,24 @@ class BundleStateDetector:
                     app_names.append(app_id.title())  # Fallback to capitalized ID
                 
                 # Store availability info
-                availability_info[app_id] = availability_results.get(app_id)
+                availability = availability_results.get(app_id)
+                availability_info[app_id] = availability
+                if availability and availability.is_available:
+                    available_count += 1
         
         bundle_info = {
             "is_installed": len(installed_apps) > 0,
             "installed_app_ids": installed_apps,
             "installed_app_names": app_names,
             "total_installed": len(installed_apps),
-            "manager_installed": self.is_manager_installed(),
-            "category_installed": self.is_category_installed(),
+            "manager_installed": manager_installed,
+            "category_installed": category_installed,
             "bundle_prefix": self.bundle_prefix,
             "availability_info": availability_info  # NEW: Detailed availability data
         }
         
         # Add summary of app states
         if availability_info:
-            available_count = sum(1 for avail in availability_info.values() 
-                                if avail and avail.is_available)
             orphaned_count = len(installed_apps) - available_count
             
             bundle_info.update({
@@ -157,18 +236,20 @@ class BundleStateDetector:
                 "has_orphaned_entries": orphaned_count > 0
             })
         
-        print(f"DEBUG: Enhanced bundle info result: {bundle_info}")
+        logger.debug("Enhanced bundle info result: %s", bundle_info)
         return bundle_info
     
     def get_bundle_info(self) -> Dict:
         """Get basic bundle installation information (backward compatibility)"""
-        installed_apps = self.get_installed_bundle_apps()
+        installed_apps, manager_installed, category_installed = self._installed_state()
         
         # Get app names for the installed apps
         app_names = []
-        if hasattr(self.config, 'app_parser'):
+        app_parser = getattr(self.config, 'app_parser', None)
+        if app_parser is not None:
+            get_app_field = app_parser.get_app_field
             for app_id in installed_apps:
-                app_name = self.config.app_parser.get_app_field(app_id, 'name')
+                app_name = get_app_field(app_id, 'name')
                 if app_name:
                     app_names.append(app_name)
                 else:
@@ -179,12 +260,12 @@ class BundleStateDetector:
             "installed_app_ids": installed_apps,
             "installed_app_names": app_names,
             "total_installed": len(installed_apps),
-            "manager_installed": self.is_manager_installed(),
-            "category_installed": self.is_category_installed(),
+            "manager_installed": manager_installed,
+            "category_installed": category_installed,
             "bundle_prefix": self.bundle_prefix
         }
         
-        print(f"DEBUG: Bundle info result: {bundle_info}")
+        logger.debug("Bundle info result: %s", bundle_info)
         return bundle_info
     
     def get_orphaned_entries(self, app_parser) -> List[Dict]:
@@ -220,7 +301,7 @@ class BundleStateDetector:
                     'availability': availability
                 })
         
-        print(f"DEBUG: Found {len(orphaned_entries)} orphaned entries")
+        logger.debug("Found %d orphaned entries", len(orphaned_entries))
         return orphaned_entries
     
     def get_missing_apps(self, all_app_ids: List[str]) -> List[str]:
@@ -233,9 +314,7 @@ class BundleStateDetector:
         Returns:
             List of app IDs not currently installed by bundle
         """
-        installed = set(self.get_installed_bundle_apps())
-        all_apps = set(all_app_ids)
-        return sorted(list(all_apps - installed))
+        return sorted(set(all_app_ids) - self._get_installed_set())
     
     def get_installation_changes(self, selected_app_ids: List[str]) -> Dict:
         """
@@ -247,14 +326,14 @@ class BundleStateDetector:
         Returns:
             Dict with 'to_add', 'to_remove', and 'no_change' lists
         """
-        currently_installed = set(self.get_installed_bundle_apps())
-        selected = set(selected_app_ids)
+        currently_installed = self._get_installed_set()
+        selected = frozenset(selected_app_ids)
         
         return {
-            "to_add": sorted(list(selected - currently_installed)),
-            "to_remove": sorted(list(currently_installed - selected)),
-            "no_change": sorted(list(selected & currently_installed)),
-            "has_changes": len(selected.symmetric_difference(currently_installed)) > 0
+            "to_add": sorted(selected - currently_installed),
+            "to_remove": sorted(currently_installed - selected),
+            "no_change": sorted(selected & currently_installed),
+            "has_changes": selected != currently_installed
         }
     
     def validate_bundle_integrity(self) -> Dict:
@@ -264,36 +343,26 @@ class BundleStateDetector:
         Returns:
             Dict with integrity information and any issues found
         """
-        issues = []
-        installed_apps = self.get_installed_bundle_apps()
+        desktop_ids, icon_ids = self._scan()
         
-        # Check for orphaned desktop files
-        for desktop_file in self.desktop_dir.glob(f"{self.bundle_prefix}-*.desktop"):
-            filename = desktop_file.stem
-            app_id = filename[len(f"{self.bundle_prefix}-"):]
-            
-            # Check if corresponding icon exists
-            icon_file = self.icons_dir / f"{self.bundle_prefix}-{app_id}.png"
-            if not icon_file.exists() and app_id not in ["manager", "main"]:
+        # Apps with a desktop file but no icon, or an icon but no desktop file
+        issues = []
+        for app_id in sorted((desktop_ids ^ icon_ids) - _RESERVED_IDS):
+            if app_id in desktop_ids:
                 issues.append(f"Missing icon for {app_id}")
-        
-        # Check for orphaned icons
-        for icon_file in self.icons_dir.glob(f"{self.bundle_prefix}-*.png"):
-            filename = icon_file.stem
-            app_id = filename[len(f"{self.bundle_prefix}-"):]
-            
-            desktop_file = self.desktop_dir / f"{self.bundle_prefix}-{app_id}.desktop"
-            if not desktop_file.exists() and app_id not in ["manager", "main"]:
+            else:
                 issues.append(f"Orphaned icon for {app_id}")
         
         return {
             "is_consistent": len(issues) == 0,
             "issues": issues,
-            "installed_apps": installed_apps,
-            "total_desktop_files": len(list(self.desktop_dir.glob(f"{self.bundle_prefix}-*.desktop"))),
-            "total_icon_files": len(list(self.icons_dir.glob(f"{self.bundle_prefix}-*.png")))
+            "installed_apps": self.get_installed_bundle_apps(),
+            "total_desktop_files": len(desktop_ids),
+            "total_icon_files": len(icon_ids)
         }
     
     def invalidate_availability_cache(self):
         """Invalidate availability cache (call after installing/removing apps)"""
-        self.availability_detector.invalidate_cache()
+        self.refresh()
+        if self._availability_detector is not None:
+            self._availability_detector.invalidate_cache()
@@ -39,9 +39,26 @@ import os
 import sys
 from pathlib import Path
 
+# User base directories, resolved once at import
+_HOME = Path.home()
+_LOCAL_SHARE = _HOME / ".local" / "share"
+_CONFIG = _HOME / ".config"
+
 class Config:
     """Configuration class to manage paths and settings"""
     
+    # app_parser is attached later by the selection page
+    __slots__ = (
+        'app_dir', '_app_dir_str',
+        'assets_dir', 'app_definitions_file', 'icons_dir', 'app_icons_dir',
+        'suite_icons_dir', 'desktop_files_dir', 'images_dir',
+        'home_dir', 'user_data_dir', 'user_config_dir', 'user_bin_dir',
+        'user_applications_dir', 'user_icons_dir', 'user_desktop_directories_dir',
+        'install_state_file', 'user_app_definitions_file',
+        'app_name', 'app_version', 'app_description',
+        'app_parser',
+    )
+    
     def __init__(self):
         # Determine if we're running from source or as an AppImage
         if getattr(sys, 'frozen', False):
@@ -50,6 +67,8 @@ class Config:
         else:
             # Running from source
             self.app_dir = Path(__file__).parent.parent.parent
+        # String prefix for the get_relative_path() fast path
+        self._app_dir_str = os.path.join(str(self.app_dir), "")
         
         # Asset paths
         self.assets_dir = self.app_dir / "assets"
@@ -61,13 +80,13 @@ class Config:
         self.images_dir = self.assets_dir / "images"
         
         # User data paths
-        self.home_dir = Path.home()
-        self.user_data_dir = self.home_dir / ".local" / "share" / "creative-suite"
-        self.user_config_dir = self.home_dir / ".config" / "creative-suite"
-        self.user_bin_dir = self.home_dir / ".local" / "bin"
-        self.user_applications_dir = self.home_dir / ".local" / "share" / "applications"
-        self.user_icons_dir = self.home_dir / ".local" / "share" / "icons"
-        self.user_desktop_directories_dir = self.home_dir / ".local" / "share" / "desktop-directories"
+        self.home_dir = _HOME
+        self.user_data_dir = _LOCAL_SHARE / "creative-suite"
+        self.user_config_dir = _CONFIG / "creative-suite"
+        self.user_bin_dir = _HOME / ".local" / "bin"
+        self.user_applications_dir = _LOCAL_SHARE / "applications"
+        self.user_icons_dir = _LOCAL_SHARE / "icons"
+        self.user_desktop_directories_dir = _LOCAL_SHARE / "desktop-directories"
         
         # State files
         self.install_state_file = self.user_data_dir / "install-state.json"
@@ -92,8 +111,17 @@ class Config:
             self.user_desktop_directories_dir
         ]
         
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
+        # ~/.local/share and ~/.config almost always exist already, in which
+        # case a single mkdir per directory is enough
+        if _LOCAL_SHARE.is_dir() and _CONFIG.is_dir():
+            for directory in directories:
+                try:
+                    os.mkdir(directory)
+                except FileExistsError:
+                    pass
+        else:
+            for directory in directories:
+                directory.mkdir(parents=True, exist_ok=True)
     
     def validate_assets(self):
         """Validate that required assets exist"""
@@ -122,6 +150,9 @@ class Config:
     
     def get_relative_path(self, path):
         """Get a path relative to the app directory"""
+        path_str = os.fspath(path)
+        if path_str.startswith(self._app_dir_str):
+            return Path(path_str[len(self._app_dir_str):])
         try:
             return Path(path).relative_to(self.app_dir)
         except ValueError:
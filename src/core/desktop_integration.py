@@ -9,16 +9,187 @@ Author: James T. Miller
 Created: 2025-06-01
 """
 
+import os
+import sys
+import errno
 import shutil
+import functools
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
+
+# How long a bundle state snapshot is reused within one operation (seconds)
+BUNDLE_INFO_TTL = 5.0
+
+# Upper bound on threads used for per-file copies and removals
+_MAX_IO_WORKERS = 16
+
+# Buffer size for the read/write copy fallback
+_COPY_CHUNK = 1 << 20
+
+# Errors meaning "this copy mechanism is not supported here", not a real I/O failure
+_COPY_UNSUPPORTED = frozenset((
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSOCK,
+))
+
+def _copy_file_range(src_fd: int, dst_fd: int, count: int) -> int:
+    return os.copy_file_range(src_fd, dst_fd, count)
+
+def _sendfile(src_fd: int, dst_fd: int, count: int) -> int:
+    return os.sendfile(dst_fd, src_fd, None, count)
+
+# In-kernel copy mechanisms still usable in this process, best first. One
+# that reports "unsupported" is dropped, so later files go straight to the
+# mechanism that works instead of failing the same probe every time.
+_KERNEL_COPIERS = [_copy_file_range, _sendfile] if hasattr(os, 'copy_file_range') else [_sendfile]
+
+def _copy_fds(src_fd: int, dst_fd: int, size: int):
+    """
+    Copy size bytes from src_fd to dst_fd at their current offsets using the
+    first usable kernel copier, then a buffered read/write loop. Each
+    fallback continues from wherever the previous mechanism stopped.
+    """
+    remaining = size
+    
+    for kernel_copy in tuple(_KERNEL_COPIERS):
+        try:
+            while remaining > 0:
+                copied = kernel_copy(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    return
+                remaining -= copied
+            return
+        except OSError as e:
+            if e.errno not in _COPY_UNSUPPORTED:
+                raise
+            try:
+                _KERNEL_COPIERS.remove(kernel_copy)
+            except ValueError:
+                pass  # Another copy thread already dropped it
+    
+    buffer = bytearray(_COPY_CHUNK)
+    view = memoryview(buffer)
+    with open(src_fd, 'rb', buffering=0, closefd=False) as source:
+        while True:
+            read = source.readinto(buffer)
+            if not read:
+                return
+            written = 0
+            while written < read:
+                written += os.write(dst_fd, view[written:read])
+
+def _fast_copy(src, dst):
+    """Copy the contents of src to dst (created or truncated), in-kernel where possible"""
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            _copy_fds(src_fd, dst_fd, os.fstat(src_fd).st_size)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+# System menu entry locations that bundle entries may duplicate
+_SYSTEM_APPLICATION_DIRS = ("/usr/share/applications", "/usr/local/share/applications")
+
+# Cache refresh tools run by flush_refresh(), keyed by what they refresh
+_REFRESH_TOOLS = {
+    "desktop": ("update-desktop-database", "✓ Updated desktop database"),
+    "icons": ("gtk-update-icon-cache", "✓ Updated icon cache"),
+}
+
+# Hidden desktop file that overrides a system entry; only the Name line varies
+_HIDDEN_PREFIX = b"[Desktop Entry]\nType=Application\nName="
+_HIDDEN_SUFFIX = b"\nNoDisplay=true\nHidden=true\n"
+
+def _in_target_dir(path, op):
+    """
+    Run op() to create path; if path's directory has vanished since
+    DesktopIntegrator._ensure_dir() created it, recreate it and retry once
+    """
+    try:
+        return op()
+    except FileNotFoundError:
+        parent = os.path.dirname(str(path))
+        if not parent or os.path.isdir(parent):
+            raise  # The directory is there, so the source is what's missing
+        os.makedirs(parent, exist_ok=True)
+        return op()
+
+def _replace_via_temp(path, fill):
+    """
+    Call fill(tmp_path) to write a sibling '<path>.tmp', then rename it over
+    path, so readers never see a partially written file
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        _in_target_dir(tmp_path, lambda: fill(tmp_path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def _write_chunks(path, chunks):
+    """Write chunks to path (created or truncated) with one gathered write"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        written = os.writev(fd, chunks)
+        total = sum(map(len, chunks))
+        if written < total:
+            # Short write: finish the remainder
+            view = memoryview(b"".join(chunks))
+            while written < total:
+                written += os.write(fd, view[written:])
+    finally:
+        os.close(fd)
+
+def _write_file(path, *chunks: bytes):
+    """Atomically replace path with the concatenated chunks"""
+    _replace_via_temp(path, lambda tmp_path: _write_chunks(tmp_path, chunks))
+
+def _install_file(src, dst):
+    """Atomically replace dst with a copy of src"""
+    _replace_via_temp(dst, lambda tmp_path: _fast_copy(src, tmp_path))
+
+def _print_lines(lines: List[str]):
+    """Print a batch of messages with a single write to stdout"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+def _io_pool(count: int) -> ThreadPoolExecutor:
+    """Thread pool sized for count independent file operations"""
+    return ThreadPoolExecutor(max_workers=max(1, min(_MAX_IO_WORKERS, count)))
 
 class DesktopIntegrator:
     """Handle desktop file and icon installation"""
     
+    # Target directories already created or confirmed this session (shared by all instances)
+    _dirs_verified = set()
+    
     def __init__(self, config):
         self.config = config
+        # Cache refreshes requested since the last flush_refresh()
+        self._pending_refresh = {"icons": False, "desktop": False}
+        # Last get_bundle_info() result and when it was taken
+        self._bundle_info_cache = None
+        self._bundle_info_time = 0.0
+    
+    def _ensure_dir(self, directory: Path):
+        """
+        Create directory (and parents) once per session; later calls make no
+        syscall, and the file writers recreate it if it is removed meanwhile
+        """
+        key = str(directory)
+        if key not in self._dirs_verified:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._dirs_verified.add(key)
     
     def install_icons(self):
         """Install custom icons to user directory"""
@@ -30,29 +201,41 @@ class DesktopIntegrator:
             return False
         
         # Ensure target directory exists
-        target_icons_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(target_icons_dir)
+        
+        # Copy all icons; the copies are independent, so overlap them
+        with os.scandir(source_icons_dir) as entries:
+            icon_files = [entry for entry in entries if entry.name.endswith(".png") and entry.is_file()]
+        target_dir = str(target_icons_dir)
+        with _io_pool(len(icon_files)) as pool:
+            errors = list(pool.map(self._copy_icon, icon_files, [target_dir] * len(icon_files)))
         
-        # Copy all icons
         icons_copied = 0
-        for icon_file in source_icons_dir.glob("*.png"):
-            target_file = target_icons_dir / icon_file.name
-            try:
-                shutil.copy2(icon_file, target_file)
+        lines = []
+        for icon_file, error in zip(icon_files, errors):
+            if error is None:
                 icons_copied += 1
-            except Exception as e:
-                print(f"Warning: Could not copy icon {icon_file.name}: {e}")
+            else:
+                lines.append(f"Warning: Could not copy icon {icon_file.name}: {error}")
         
-        print(f"Copied {icons_copied} custom icons")
+        lines.append(f"Copied {icons_copied} custom icons")
+        _print_lines(lines)
         
-        # Update icon cache if possible
-        try:
-            subprocess.run(['gtk-update-icon-cache', str(target_icons_dir)], 
-                         capture_output=True, check=False, timeout=10)
-        except:
-            pass  # Icon cache update is optional
+        # Icon cache is updated once by flush_refresh()
+        self._pending_refresh["icons"] = True
         
         return icons_copied > 0
     
+    @staticmethod
+    def _copy_icon(icon_file: os.DirEntry, target_icons_dir: str) -> Optional[Exception]:
+        """Copy one icon; returns the error instead of raising so callers can report in order"""
+        try:
+            target = os.path.join(target_icons_dir, icon_file.name)
+            _in_target_dir(target, lambda: _fast_copy(icon_file.path, target))
+            return None
+        except Exception as e:
+            return e
+    
     def install_desktop_files(self, selected_apps: List[Dict]):
         """Install desktop files for selected applications"""
         source_desktop_dir = self.config.desktop_files_dir
@@ -73,8 +256,8 @@ class DesktopIntegrator:
             print(f"DEBUG: Available desktop files: {[f.name for f in available_files]}")
         
         # Ensure target directories exist
-        target_desktop_dir.mkdir(parents=True, exist_ok=True)
-        target_directory_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(target_desktop_dir)
+        self._ensure_dir(target_directory_dir)
         
         # Get suite info for directory file
         suite_info = self.config.app_parser.get_suite_info() if hasattr(self.config, 'app_parser') else {}
@@ -102,7 +285,7 @@ class DesktopIntegrator:
             if source_desktop_file.exists():
                 target_desktop_file = target_desktop_dir / desktop_file_name
                 try:
-                    shutil.copy2(source_desktop_file, target_desktop_file)
+                    _install_file(source_desktop_file, target_desktop_file)
                     desktop_files_installed += 1
                     print(f"✓ Installed desktop file for {app.get('name', app_id)}")
                 except Exception as e:
@@ -114,16 +297,51 @@ class DesktopIntegrator:
         # Hide original system desktop files to prevent duplicates
         self.hide_system_desktop_files(selected_apps, target_desktop_dir)
         
-        # Update desktop database
-        try:
-            subprocess.run(['update-desktop-database', str(target_desktop_dir)], 
-                         capture_output=True, check=False, timeout=10)
-        except:
-            pass  # Desktop database update is optional
+        # Desktop database is updated once by flush_refresh()
+        self._pending_refresh["desktop"] = True
+        self._bundle_info_cache = None
         
         print(f"Installed {desktop_files_installed} desktop files")
         return desktop_files_installed > 0
     
+    def flush_refresh(self):
+        """
+        Run the desktop database / icon cache updates requested since the
+        last flush, each tool once and both concurrently. Call after the
+        last install or removal step of an operation.
+        """
+        targets = {
+            "desktop": self.config.user_applications_dir,
+            "icons": self.config.user_icons_dir,
+        }
+        
+        running = []
+        for kind, pending in self._pending_refresh.items():
+            if not pending:
+                continue
+            self._pending_refresh[kind] = False
+            tool, done_message = _REFRESH_TOOLS[kind]
+            tool_path = shutil.which(tool)
+            if tool_path is None:
+                continue  # Cache updates are optional
+            try:
+                # An absolute path and close_fds=False let CPython use posix_spawn;
+                # our fds are non-inheritable by default (PEP 446), so none leak
+                process = subprocess.Popen([tool_path, str(targets[kind])],
+                                           stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                           stderr=subprocess.DEVNULL, close_fds=False)
+                running.append((process, done_message))
+            except OSError:
+                pass  # Cache updates are optional
+        
+        for process, done_message in running:
+            try:
+                process.wait(timeout=10)
+                print(done_message)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+    
     def create_category_directory_file(self, target_dir: Path, suite_name: str):
         """Create the Creative Suite category directory file"""
         directory_file = target_dir / "X-Creative-Suite.directory"
@@ -138,42 +356,49 @@ Name[en_US]={suite_name}
 """
         
         try:
-            with open(directory_file, 'w', encoding='utf-8') as f:
-                f.write(directory_content)
+            _write_file(directory_file, directory_content.encode('utf-8'))
             print(f"Created category directory file for {suite_name}")
         except Exception as e:
             print(f"Warning: Could not create category directory file: {e}")
     
     def hide_system_desktop_files(self, selected_apps: List[Dict], target_dir: Path):
         """Hide original system desktop files to prevent duplicates"""
+        # List each system directory once instead of probing every app's file
+        system_desktop_files = set()
+        for directory in _SYSTEM_APPLICATION_DIRS:
+            try:
+                system_desktop_files.update(os.listdir(directory))
+            except OSError:
+                pass
+        
+        # Create hidden desktop files that override the system ones
+        target_dir_str = str(target_dir)
+        hidden_ids = []
+        hidden_paths = []
         for app in selected_apps:
             app_id = app.get('id')
-            if not app_id:
-                continue
-            
-            # Create hidden desktop file that overrides system one
-            system_desktop_paths = [
-                Path(f"/usr/share/applications/{app_id}.desktop"),
-                Path(f"/usr/local/share/applications/{app_id}.desktop")
-            ]
-            
-            # Check if system desktop file exists
-            system_file_exists = any(path.exists() for path in system_desktop_paths)
-            
-            if system_file_exists:
-                hidden_desktop_file = target_dir / f"{app_id}.desktop"
-                hidden_content = f"""[Desktop Entry]
-Type=Application
-Name={app_id}
-NoDisplay=true
-Hidden=true
-"""
-                try:
-                    with open(hidden_desktop_file, 'w', encoding='utf-8') as f:
-                        f.write(hidden_content)
-                    print(f"Hidden system desktop file for {app_id}")
-                except Exception as e:
-                    print(f"Warning: Could not hide system desktop file for {app_id}: {e}")
+            if app_id and f"{app_id}.desktop" in system_desktop_files:
+                hidden_ids.append(app_id)
+                hidden_paths.append(os.path.join(target_dir_str, f"{app_id}.desktop"))
+        
+        # The writes are independent, so overlap them and report in order afterwards
+        with _io_pool(len(hidden_paths)) as pool:
+            errors = list(pool.map(self._write_hidden_file, hidden_paths, hidden_ids))
+        
+        _print_lines([
+            f"Hidden system desktop file for {app_id}" if error is None
+            else f"Warning: Could not hide system desktop file for {app_id}: {error}"
+            for app_id, error in zip(hidden_ids, errors)
+        ])
+    
+    @staticmethod
+    def _write_hidden_file(path: str, app_id: str) -> Optional[Exception]:
+        """Write one hidden desktop file; returns the error instead of raising"""
+        try:
+            _write_file(path, _HIDDEN_PREFIX, app_id.encode('utf-8'), _HIDDEN_SUFFIX)
+            return None
+        except Exception as e:
+            return e
     
     def create_manager_script(self):
         """Create the Creative Suite manager script - DISABLED: Not needed for Python version"""
@@ -182,8 +407,6 @@ Hidden=true
     
     def create_manager_desktop_entry_if_needed(self):
         """Create manager desktop entry only if appropriate"""
-        import os
-        
         # For development, always create
         if not os.environ.get('APPIMAGE'):
             print("DEBUG: Running from source - creating manager desktop entry")
@@ -219,7 +442,6 @@ Hidden=true
         suite_name = suite_info.get('name', 'Application Bundle')
         
         # Determine the correct exec path
-        import os
         import sys
         
         if os.environ.get('APPIMAGE'):
@@ -277,8 +499,7 @@ StartupNotify=true
 """
         
         try:
-            with open(manager_desktop_file, 'w', encoding='utf-8') as f:
-                f.write(desktop_content)
+            _write_file(manager_desktop_file, desktop_content.encode('utf-8'))
             print(f"Created/Updated 'Manage {suite_name}' desktop entry")
             return True
         except Exception as e:
@@ -295,57 +516,89 @@ StartupNotify=true
         Returns:
             Number of apps successfully removed
         """
-        target_desktop_dir = self.config.user_applications_dir
-        target_icons_dir = self.config.user_icons_dir
-        
-        removed_count = 0
-        
         print(f"Removing {len(app_ids)} applications from bundle...")
         
         # Remove bundle desktop files for specified apps
-        for app_id in app_ids:
-            # Remove bundle desktop file
-            bundle_desktop_file = target_desktop_dir / f"creative-suite-{app_id}.desktop"
-            if bundle_desktop_file.exists():
-                try:
-                    bundle_desktop_file.unlink()
-                    removed_count += 1
-                    print(f"✓ Removed bundle menu entry for {app_id}")
-                except Exception as e:
-                    print(f"Warning: Could not remove bundle menu entry for {app_id}: {e}")
-            
-            # Remove hidden system desktop file (restore original)
-            hidden_desktop_file = target_desktop_dir / f"{app_id}.desktop"
-            if hidden_desktop_file.exists():
-                try:
-                    # Check if this is our hidden file
-                    with open(hidden_desktop_file, 'r') as f:
-                        content = f.read()
-                    if "NoDisplay=true" in content and "Hidden=true" in content:
-                        hidden_desktop_file.unlink()
-                        print(f"✓ Restored original menu entry for {app_id}")
-                except Exception as e:
-                    print(f"Warning: Could not restore original menu entry for {app_id}: {e}")
-            
-            # Remove bundle icons
-            for icon_ext in ['.png', '.svg']:
-                icon_file = target_icons_dir / f"creative-suite-{app_id}{icon_ext}"
-                if icon_file.exists():
-                    try:
-                        icon_file.unlink()
-                        print(f"✓ Removed custom icon for {app_id}")
-                    except Exception as e:
-                        print(f"Warning: Could not remove icon for {app_id}: {e}")
-        
-        # Update desktop database
+        removed_count = self._remove_apps_integration(app_ids, "bundle menu entry")
+        
+        # Desktop database is updated once by flush_refresh()
+        self._pending_refresh["desktop"] = True
+        self._bundle_info_cache = None
+        
+        print(f"Successfully removed {removed_count} applications from bundle")
+        return removed_count
+    
+    @staticmethod
+    def _remove_app_files(app_id: str, entry_label: str, desktop_dir: str, icons_dir: str) -> Tuple[bool, List[str]]:
+        """
+        Remove one app's bundle desktop file, hidden system override and icons
+        
+        Returns:
+            (whether the bundle desktop file was removed, messages to print)
+        """
+        removed = False
+        messages = []
+        
+        # Remove bundle desktop file (a missing file is simply skipped)
+        try:
+            os.unlink(f"{desktop_dir}/creative-suite-{app_id}.desktop")
+            removed = True
+            messages.append(f"✓ Removed {entry_label} for {app_id}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            messages.append(f"Warning: Could not remove {entry_label} for {app_id}: {e}")
+        
+        # Remove hidden system desktop file (restore original)
+        hidden_desktop_file = f"{desktop_dir}/{app_id}.desktop"
         try:
-            subprocess.run(['update-desktop-database', str(target_desktop_dir)], 
-                         capture_output=True, check=False, timeout=10)
-            print("✓ Updated desktop database")
-        except:
+            # Check if this is our hidden file; its markers are within the first
+            # few dozen bytes, so a larger user-authored file is never read in full
+            with open(hidden_desktop_file, 'rb') as f:
+                head = f.read(256)
+            if b"NoDisplay=true" in head and b"Hidden=true" in head:
+                os.unlink(hidden_desktop_file)
+                messages.append(f"✓ Restored original menu entry for {app_id}")
+        except FileNotFoundError:
             pass
+        except Exception as e:
+            messages.append(f"Warning: Could not restore original menu entry for {app_id}: {e}")
         
-        print(f"Successfully removed {removed_count} applications from bundle")
+        # Remove bundle icons
+        for icon_ext in ['.png', '.svg']:
+            try:
+                os.unlink(f"{icons_dir}/creative-suite-{app_id}{icon_ext}")
+                messages.append(f"✓ Removed custom icon for {app_id}")
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                messages.append(f"Warning: Could not remove icon for {app_id}: {e}")
+        
+        return removed, messages
+    
+    def _remove_apps_integration(self, app_ids: List[str], entry_label: str) -> int:
+        """
+        Remove the bundle files of several apps concurrently, printing all
+        messages in app order with one write once the removals are done
+        
+        Returns:
+            Number of apps whose bundle desktop file was removed
+        """
+        remove = functools.partial(
+            self._remove_app_files,
+            entry_label=entry_label,
+            desktop_dir=str(self.config.user_applications_dir),
+            icons_dir=str(self.config.user_icons_dir),
+        )
+        with _io_pool(len(app_ids)) as pool:
+            results = list(pool.map(remove, app_ids))
+        
+        removed_count = 0
+        lines = []
+        for removed, messages in results:
+            removed_count += removed
+            lines.extend(messages)
+        _print_lines(lines)
         return removed_count
     
     def show_bundle_removal_explanation(self, suite_name: str, app_names: List[str]) -> bool:
@@ -353,9 +606,6 @@ StartupNotify=true
         Show user explanation of what bundle removal does
         Returns: True if user confirms, False if cancelled
         """
-        import tkinter as tk
-        from tkinter import messagebox
-        
         explanation = f"""Bundle Removal - What This Does:
 
 ✓ Removes {suite_name} menu entries and custom icons
@@ -383,10 +633,44 @@ sudo apt autoremove
 
 Continue with {suite_name} removal?"""
         
-        return messagebox.askyesno(
-            f"Remove {suite_name}",
-            explanation
-        )
+        title = f"Remove {suite_name}"
+        
+        # Inside the Qt GUI, ask with a Qt dialog (imported lazily like the GUI
+        # itself); widgets may only be created on the GUI thread
+        try:
+            from PySide2.QtCore import QThread
+            from PySide2.QtWidgets import QApplication, QMessageBox
+            app = QApplication.instance()
+        except ImportError:
+            app = None
+        if app is not None and app.thread() == QThread.currentThread():
+            answer = QMessageBox.question(None, title, explanation, QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+            return answer == QMessageBox.Yes
+        
+        # Otherwise fall back to Tk, which needs an X display. Removal is
+        # destructive, so without a way to ask it is refused, not assumed
+        if os.environ.get('DISPLAY'):
+            try:
+                # Imported here so importing this module never loads Tk
+                from tkinter import messagebox
+                return messagebox.askyesno(title, explanation)
+            except Exception as e:
+                print(f"Warning: Could not show the removal confirmation dialog: {e}")
+        
+        print(f"Cannot confirm removal of {suite_name} without a display - nothing was removed")
+        return False
+    
+    def _get_bundle_info(self) -> Dict:
+        """
+        Current bundle state, reused for BUNDLE_INFO_TTL seconds; the
+        install/remove methods drop it after changing bundle files
+        """
+        now = time.monotonic()
+        if self._bundle_info_cache is None or now - self._bundle_info_time > BUNDLE_INFO_TTL:
+            from core.bundle_state_detector import BundleStateDetector
+            self._bundle_info_cache = BundleStateDetector(self.config).get_bundle_info()
+            self._bundle_info_time = now
+        return self._bundle_info_cache
     
     def remove_entire_bundle(self, suite_name: str) -> bool:
         """
@@ -398,11 +682,8 @@ Continue with {suite_name} removal?"""
         Returns:
             True if removal completed, False if cancelled
         """
-        from core.bundle_state_detector import BundleStateDetector
-        
         # Get current bundle state
-        state_detector = BundleStateDetector(self.config)
-        bundle_info = state_detector.get_bundle_info()
+        bundle_info = self._get_bundle_info()
         
         if not bundle_info["is_installed"]:
             print("No bundle installation found")
@@ -415,7 +696,10 @@ Continue with {suite_name} removal?"""
         if not self.show_bundle_removal_explanation(suite_name, app_names):
             return False  # User cancelled
         
-        return self.uninstall_bundle_integration(app_ids, suite_name, app_names)
+        try:
+            return self.uninstall_bundle_integration(app_ids, suite_name, app_names)
+        finally:
+            self.flush_refresh()
     
     def uninstall_bundle_integration(self, app_ids: List[str], suite_name: str = None, app_names: List[str] = None):
         """
@@ -427,81 +711,37 @@ Continue with {suite_name} removal?"""
             app_names: Human-readable app names (for user dialog)
         """
         target_desktop_dir = self.config.user_applications_dir
-        target_icons_dir = self.config.user_icons_dir
-        
-        removed_count = 0
         
         print(f"Removing {suite_name or 'bundle'} integration...")
         
         # Remove bundle desktop files
-        for app_id in app_ids:
-            # Remove bundle desktop file
-            bundle_desktop_file = target_desktop_dir / f"creative-suite-{app_id}.desktop"
-            if bundle_desktop_file.exists():
-                try:
-                    bundle_desktop_file.unlink()
-                    removed_count += 1
-                    print(f"✓ Removed menu entry for {app_id}")
-                except Exception as e:
-                    print(f"Warning: Could not remove menu entry for {app_id}: {e}")
-            
-            # Remove hidden system desktop file (restore original)
-            hidden_desktop_file = target_desktop_dir / f"{app_id}.desktop"
-            if hidden_desktop_file.exists():
-                try:
-                    # Check if this is our hidden file
-                    with open(hidden_desktop_file, 'r') as f:
-                        content = f.read()
-                    if "NoDisplay=true" in content and "Hidden=true" in content:
-                        hidden_desktop_file.unlink()
-                        print(f"✓ Restored original menu entry for {app_id}")
-                except Exception as e:
-                    print(f"Warning: Could not restore original menu entry for {app_id}: {e}")
-            
-            # Remove bundle icons
-            for icon_ext in ['.png', '.svg']:
-                icon_file = target_icons_dir / f"creative-suite-{app_id}{icon_ext}"
-                if icon_file.exists():
-                    try:
-                        icon_file.unlink()
-                        print(f"✓ Removed custom icon for {app_id}")
-                    except Exception as e:
-                        print(f"Warning: Could not remove icon for {app_id}: {e}")
+        removed_count = self._remove_apps_integration(app_ids, "menu entry")
         
         # Remove the manager desktop entry if this is a complete uninstall
         manager_desktop_file = target_desktop_dir / "creative-suite-manager.desktop"
-        if manager_desktop_file.exists():
-            try:
-                manager_desktop_file.unlink()
-                print("✓ Removed bundle manager menu entry")
-            except Exception as e:
-                print(f"Warning: Could not remove manager menu entry: {e}")
+        try:
+            manager_desktop_file.unlink()
+            print("✓ Removed bundle manager menu entry")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Warning: Could not remove manager menu entry: {e}")
         
         # Remove the category directory file
         target_directory_dir = self.config.user_desktop_directories_dir
         category_file = target_directory_dir / "X-Creative-Suite.directory"
-        if category_file.exists():
-            try:
-                category_file.unlink()
-                print("✓ Removed bundle category")
-            except Exception as e:
-                print(f"Warning: Could not remove category file: {e}")
-        
-        # Update desktop database
         try:
-            subprocess.run(['update-desktop-database', str(target_desktop_dir)], 
-                         capture_output=True, check=False, timeout=10)
-            print("✓ Updated desktop database")
-        except:
+            category_file.unlink()
+            print("✓ Removed bundle category")
+        except FileNotFoundError:
             pass
+        except Exception as e:
+            print(f"Warning: Could not remove category file: {e}")
         
-        # Update icon cache
-        try:
-            subprocess.run(['gtk-update-icon-cache', str(target_icons_dir)], 
-                         capture_output=True, check=False, timeout=10)
-            print("✓ Updated icon cache")
-        except:
-            pass
+        # Desktop database and icon cache are updated once by flush_refresh()
+        self._pending_refresh["desktop"] = True
+        self._pending_refresh["icons"] = True
+        self._bundle_info_cache = None
         
         print(f"\n✓ Bundle removal complete!")
         print(f"✓ Removed menu integration for {removed_count} applications")
@@ -109,6 +109,7 @@ class InstallationWorker(QObject):
         
         # Step 3: Desktop integration
         desktop_success = self.install_desktop_integration_step()
+        self.desktop_integrator.flush_refresh()
         
         # Final step
         self.current_step += 1
@@ -244,6 +245,9 @@ class InstallationWorker(QObject):
                     self.installation_errors.append(error_msg)
                     self.app_progress_updated.emit("Menu Integration", "Error", False)
         
+        # Refresh the desktop database and icon cache once for all changes above
+        self.desktop_integrator.flush_refresh()
+        
         # Final step
         self.current_step = self.total_steps
         self.progress_updated.emit(self.current_step, self.total_steps, "Modification complete!")
@@ -280,6 +284,7 @@ class InstallationWorker(QObject):
                 suite_name=None,
                 app_names=None
             )
+            self.desktop_integrator.flush_refresh()
             
             if removal_success:
                 self.log_message.emit(f"✓ {self.suite_name} removed successfully", "success")
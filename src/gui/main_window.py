@@ -10,7 +10,6 @@ Created: 2025-06-01
 Ported to PySide2: 2025-07-12
 """
 
-import sys
 import traceback
 from pathlib import Path
 
@@ -24,7 +23,6 @@ from PySide2.QtGui import QFont
 
 # Import your existing pages (we'll port these next)
 from gui.welcome_page import WelcomePage
-from gui.selection_page import SelectionPage
 from gui.installation_page import InstallationPage
 from gui.manager_page import ManagerPage
 from utils.json_parser import AppDefinitionParser
@@ -107,7 +105,19 @@ class MainWindow(QMainWindow):
         self.current_page_type = None
         self.current_page = None
         self.success_banner = None
+        self.app_parser = None
         
+        # Build the bare window so it can be shown right away; loading the
+        # app definitions and the first page happens in deferred_init()
+        self._setup_window()
+        self._create_widgets()
+        self._apply_styling()
+        
+        self.next_button.setEnabled(False)
+        self.status_label.setText("Loading...")
+    
+    def deferred_init(self):
+        """Load app definitions and show the first page (run after the window is shown)"""
         # Try to load and validate app definitions
         try:
             self.config.validate_assets()
@@ -123,12 +133,11 @@ class MainWindow(QMainWindow):
                 f"Failed to load application definitions:\n\n{str(e)}\n\n"
                 "Please check that the installer package is complete."
             )
-            sys.exit(1)
+            QApplication.exit(1)
+            return
         
-        # Set up the GUI
-        self._setup_window()
-        self._create_widgets()
-        self._apply_styling()
+        # Titles come from the app definitions
+        self._update_window_title()
         
         # Handle AppImage integration if needed
         self._handle_appimage_integration()
@@ -137,7 +146,16 @@ class MainWindow(QMainWindow):
         self.show_welcome_page()
     
     def _setup_window(self):
-        """Configure the main window with JSON-driven titles"""
+        """Configure the main window size and position"""
+        self.setWindowTitle("Installer - Loading Screen Solutions")
+        self.setMinimumSize(700, 500)
+        self.resize(800, 600)
+        
+        # Center window on screen
+        self._center_window()
+    
+    def _update_window_title(self):
+        """Set the JSON-driven window title"""
         suite_info = self.app_parser.get_suite_info()
         suite_name = suite_info.get('name', 'Application Bundle Installer')
         suite_version = suite_info.get('version', '1.0')
@@ -145,11 +163,6 @@ class MainWindow(QMainWindow):
         # Dynamic window title
         window_title = f"{suite_name} Installer v{suite_version} - Loading Screen Solutions"
         self.setWindowTitle(window_title)
-        self.setMinimumSize(700, 500)
-        self.resize(800, 600)
-        
-        # Center window on screen
-        self._center_window()
     
     def _center_window(self):
         """Center the window on the screen"""
@@ -268,6 +281,10 @@ class MainWindow(QMainWindow):
         print(f"DEBUG: MainWindow.show_selection_page called with message: {success_message}")
         self._clear_content_stack()
         
+        # Imported on first use so the welcome page doesn't wait on the
+        # selection page and bundle state detection modules
+        from gui.selection_page import SelectionPage
+        
         # Create a temporary widget container for the tkinter-style page
         container = QWidget()
         self.current_page = SelectionPage(
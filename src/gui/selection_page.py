@@ -10,189 +10,433 @@ Created: 2025-06-01
 Ported to PySide2: 2025-07-12
 """
 
+import os
+import logging
+import functools
 from pathlib import Path
 from PySide2.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QScrollArea, QFrame,
-    QLabel, QPushButton, QCheckBox, QGroupBox, QTextEdit,
-    QMessageBox, QSizePolicy
+    QLabel, QPushButton, QGroupBox, QMessageBox,
+    QApplication, QListView, QAbstractItemView, QStyledItemDelegate,
+    QStyle, QStyleOptionButton
 )
-from PySide2.QtCore import Qt, QSize
-from PySide2.QtGui import QFont, QPixmap
+from PySide2.QtCore import Qt, QSize, QRect, QEvent, QAbstractListModel, QModelIndex, Signal
+from PySide2.QtGui import QFont, QFontMetrics, QColor, QIcon, QPen, QPainter, QPalette, QPixmap, QPixmapCache
 
 from gui.base_page import BasePage
-from core.bundle_state_detector import BundleStateDetector
+
+logger = logging.getLogger(__name__)
+
+# Stylesheets and fonts shared by every widget instance, so Qt parses/builds them once
+_BUTTON_QSS_TEMPLATE = """
+QPushButton {
+    background-color: %s;
+    color: white;
+    border: none;
+    padding: 6px 12px;
+    border-radius: 4px;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background-color: %s;
+}
+QPushButton:pressed {
+    background-color: %s;
+}
+"""
+
+# (normal, hover, pressed) background colors per button type
+_BUTTON_PALETTES = {
+    "normal": ("#007bff", "#0056b3", "#004085"),
+    "danger": ("#dc3545", "#c82333", "#bd2130"),
+}
+
+_BUTTON_QSS = {name: _BUTTON_QSS_TEMPLATE % colors for name, colors in _BUTTON_PALETTES.items()}
+
+# App lists draw their own rows; let the group box show through
+_LIST_QSS = """
+QListView {
+    background: transparent;
+}
+"""
+
+@functools.lru_cache(maxsize=None)
+def _bold_font(point_size):
+    """Shared bold QFont of the given point size"""
+    font = QFont()
+    font.setBold(True)
+    font.setPointSize(point_size)
+    return font
+
+@functools.lru_cache(maxsize=None)
+def _pixel_font(pixel_size, bold=False, italic=False):
+    """Shared QFont of the given pixel size"""
+    font = QFont()
+    font.setPixelSize(pixel_size)
+    font.setBold(bold)
+    font.setItalic(italic)
+    return font
 
 class ModernButton(QPushButton):
     """Modern styled button"""
     def __init__(self, text, button_type="normal", parent=None):
         super().__init__(text, parent)
-        
-        if button_type == "danger":
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #dc3545;
-                    color: white;
-                    border: none;
-                    padding: 6px 12px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #c82333;
-                }
-                QPushButton:pressed {
-                    background-color: #bd2130;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #007bff;
-                    color: white;
-                    border: none;
-                    padding: 6px 12px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #0056b3;
-                }
-                QPushButton:pressed {
-                    background-color: #004085;
-                }
-            """)
+        self.setStyleSheet(_BUTTON_QSS.get(button_type, _BUTTON_QSS["normal"]))
+
+# Bundle icon file per app id (None if the bundle has no icon for it)
+_resolved_icon_paths = {}
+# File names in config.app_icons_dir, listed once
+_bundle_icon_names = None
+# App ids with no icon anywhere, so misses aren't looked up again
+_missing_icons = set()
+
+def resolve_icon_path(app_id, config):
+    """Find the app's icon in the bundle icon directory, memoized per app id"""
+    global _bundle_icon_names
+    
+    if app_id in _resolved_icon_paths:
+        return _resolved_icon_paths[app_id]
+    
+    # List the bundle icon directory once instead of probing it per app
+    if _bundle_icon_names is None:
+        try:
+            with os.scandir(config.app_icons_dir) as entries:
+                _bundle_icon_names = {entry.name for entry in entries}
+        except OSError:
+            _bundle_icon_names = set()
+    
+    resolved = None
+    for name in (f"creative-suite-{app_id}.png", f"{app_id}.png"):
+        if name in _bundle_icon_names:
+            resolved = config.app_icons_dir / name
+            break
+    
+    _resolved_icon_paths[app_id] = resolved
+    return resolved
 
-class AppEntryWidget(QFrame):
-    """Custom widget for each application entry"""
+def load_app_icon(app_id, config):
+    """Load app icon with fallback options (cached in QPixmapCache)"""
+    key = f"cs:icon:{app_id}"
+    
+    if app_id in _missing_icons:
+        return None
+    
+    pixmap = QPixmapCache.find(key)
+    if pixmap:
+        return pixmap
+    
+    # Pre-scaled icon compiled into icons.rcc at build time (no filesystem access)
+    pixmap = QPixmap(f":/creative-suite/icons/{app_id}.png")
+    if not pixmap.isNull():
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+    
+    icon_path = resolve_icon_path(app_id, config)
+    if icon_path is None:
+        # System icon theme (hicolor etc.) through Qt's indexed theme cache
+        icon = QIcon.fromTheme(app_id)
+        if not icon.isNull():
+            pixmap = icon.pixmap(QSize(32, 32))
+            QPixmapCache.insert(key, pixmap)
+            return pixmap
+        
+        icon_path = Path(f"/usr/share/pixmaps/{app_id}.png")
+        if not icon_path.exists():
+            _missing_icons.add(app_id)
+            return None
     
-    def __init__(self, app_data, is_currently_installed, config, parent=None):
+    try:
+        pixmap = QPixmap(str(icon_path))
+    except Exception as e:
+        logger.warning("Could not load icon %s: %s", icon_path, e)
+        return None
+    
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+def load_scaled_app_icon(app_id, config, size):
+    """Return the app icon scaled to size x size, scaling each icon only once"""
+    key = f"cs:icon{size}:{app_id}"
+    scaled = QPixmapCache.find(key)
+    if not scaled:
+        icon_pixmap = load_app_icon(app_id, config)
+        if not icon_pixmap:
+            return None
+        scaled = icon_pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        QPixmapCache.insert(key, scaled)
+    return scaled
+
+@functools.lru_cache(maxsize=None)
+def _placeholder_pixmap(size):
+    """Shared stand-in for apps without an icon, rendered once per size"""
+    pixmap = QPixmap(size, size)
+    pixmap.fill(Qt.transparent)
+    
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor("#e0e0e0"))
+    painter.drawRoundedRect(0, 0, size, size, 6, 6)
+    painter.setPen(QColor("black"))
+    painter.setFont(_pixel_font(18))
+    painter.drawText(pixmap.rect(), Qt.AlignCenter, "📱")
+    painter.end()
+    
+    return pixmap
+
+# Extra model roles used by AppDelegate
+APP_DATA_ROLE = Qt.UserRole + 1
+INSTALLED_ROLE = Qt.UserRole + 2
+
+class AppListModel(QAbstractListModel):
+    """Checkable list of the apps in one category"""
+    
+    checkToggled = Signal(str, bool)
+    
+    def __init__(self, apps, selected_ids, installed_ids, config, parent=None):
         super().__init__(parent)
-        self.app_data = app_data
-        self.is_currently_installed = is_currently_installed
+        self._apps = apps
+        self._selected_ids = selected_ids  # Shared with SelectionPage, updated in place
+        self._installed_ids = installed_ids
         self.config = config
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._apps)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
         
-        self.setFrameStyle(QFrame.Box)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #e0e0e0;
-                border-radius: 6px;
-                padding: 8px;
-                margin: 4px;
-            }
-            QFrame:hover {
-                border-color: #007bff;
-                background-color: #f8f9ff;
-            }
-        """)
+        app = self._apps[index.row()]
+        app_id = app.get('id')
         
-        self.setup_ui()
+        if role == Qt.DisplayRole:
+            return app.get('name', 'Unknown')
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if app_id in self._selected_ids else Qt.Unchecked
+        if role == Qt.DecorationRole:
+            # Only requested when the row is painted, so icons load lazily
+            return load_scaled_app_icon(app_id, self.config, 32)
+        if role == Qt.ToolTipRole:
+            return app.get('description') or None
+        if role == APP_DATA_ROLE:
+            return app
+        if role == INSTALLED_ROLE:
+            return app_id in self._installed_ids
+        return None
     
-    def setup_ui(self):
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(10, 8, 10, 8)
-        layout.setSpacing(10)
-        
-        # Checkbox
-        self.checkbox = QCheckBox()
-        # Set initial state
-        if self.is_currently_installed:
-            self.checkbox.setChecked(True)
-        else:
-            self.checkbox.setChecked(self.app_data.get('default_selected', False))
-        layout.addWidget(self.checkbox)
-        
-        # Icon
-        icon_label = QLabel()
-        icon_label.setFixedSize(60, 60)  # Larger container for breathing room
-        
-        # Load icon
-        icon_pixmap = self.load_app_icon()
-        if icon_pixmap:
-            scaled_pixmap = icon_pixmap.scaled(32, 32, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            icon_label.setPixmap(scaled_pixmap)
-            icon_label.setAlignment(Qt.AlignCenter)  # Center the 32px icon in the 60px container
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or not index.isValid():
+            return False
+        
+        app_id = self._apps[index.row()].get('id')
+        checked = value == Qt.Checked
+        if checked:
+            self._selected_ids.add(app_id)
         else:
-            icon_label.setStyleSheet("background-color: #e0e0e0; border-radius: 6px; font-size: 18px;")
-            icon_label.setText("📱")
-            icon_label.setAlignment(Qt.AlignCenter)
-        
-        layout.addWidget(icon_label)
-        
-        # App info
-        info_widget = QWidget()
-        info_layout = QVBoxLayout(info_widget)
-        info_layout.setContentsMargins(0, 0, 0, 0)
-        info_layout.setSpacing(2)
-        
-        # App name
-        name_label = QLabel(self.app_data.get('name', 'Unknown'))
-        name_font = QFont()
-        name_font.setBold(True)
-        name_font.setPointSize(11)
-        name_label.setFont(name_font)
-        info_layout.addWidget(name_label)
+            self._selected_ids.discard(app_id)
         
-        # Description
-        description = self.app_data.get('description', '')
+        self.dataChanged.emit(index, index)
+        self.checkToggled.emit(app_id, checked)
+        return True
+    
+    def set_checked_where(self, predicate):
+        """Check the apps matching predicate(app), with one repaint for the whole list"""
+        for app in self._apps:
+            if predicate(app):
+                self._selected_ids.add(app.get('id'))
+            else:
+                self._selected_ids.discard(app.get('id'))
+        
+        if self._apps:
+            self.dataChanged.emit(self.index(0), self.index(len(self._apps) - 1))
+
+class AppDelegate(QStyledItemDelegate):
+    """Paints an application row: checkbox, icon, name, description and tags"""
+    
+    OUTER_MARGIN = 4
+    H_PADDING = 10
+    V_PADDING = 8
+    SPACING = 10
+    ICON_BOX = 60  # Larger container for breathing room
+    LINE_SPACING = 2
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._border = QColor("#e0e0e0")
+        self._hover_border = QColor("#007bff")
+        self._background = QColor("white")
+        self._hover_background = QColor("#f8f9ff")
+        
+        # Text line styles: (font, color or None for the palette text color, metrics)
+        self._name_style = self._line_style(_bold_font(11), None)
+        self._desc_style = self._line_style(_pixel_font(9), "#666666")
+        self._equiv_style = self._line_style(_pixel_font(9, italic=True), "#0066cc")
+        self._installed_style = self._line_style(_pixel_font(8, bold=True), "#28a745")
+        self._required_style = self._line_style(_pixel_font(8, bold=True), "#007bff")
+        
+        # Laid-out text per row for the current text width:
+        # {(app_id, installed): (lines, text_height)}
+        self._row_layouts = {}
+        self._layout_width = None
+    
+    @staticmethod
+    def _line_style(font, color):
+        return font, QColor(color) if color else None, QFontMetrics(font)
+    
+    def _row_layout(self, app, installed, text_width):
+        """
+        (style, text, height, wrap) for each text line of a row, plus the block
+        height; the description word-wraps, the other lines are single elided lines
+        """
+        # All lists share one width, so only the layouts for the latest width are kept
+        if text_width != self._layout_width:
+            self._row_layouts.clear()
+            self._layout_width = text_width
+        
+        key = (app.get('id'), installed)
+        row_layout = self._row_layouts.get(key)
+        if row_layout is not None:
+            return row_layout
+        
+        lines = [self._single_line(self._name_style, app.get('name', 'Unknown'))]
+        
+        description = app.get('description', '')
         if description:
-            desc_label = QLabel(description)
-            desc_label.setStyleSheet("color: #666666; font-size: 9px;")
-            desc_label.setWordWrap(True)
-            info_layout.addWidget(desc_label)
+            metrics = self._desc_style[2]
+            wrapped = metrics.boundingRect(QRect(0, 0, text_width, 0), Qt.TextWordWrap, description)
+            lines.append((self._desc_style, description, wrapped.height(), True))
         
-        # Adobe equivalent
-        adobe_equiv = self.app_data.get('adobe_equivalent', '')
+        adobe_equiv = app.get('adobe_equivalent', '')
         if adobe_equiv:
-            equiv_label = QLabel(f"Alternative to: {adobe_equiv}")
-            equiv_label.setStyleSheet("color: #0066cc; font-size: 9px; font-style: italic;")
-            info_layout.addWidget(equiv_label)
+            lines.append(self._single_line(self._equiv_style, f"Alternative to: {adobe_equiv}"))
         
         # Status indicators
-        if self.is_currently_installed:
-            status_label = QLabel("[CURRENTLY IN BUNDLE]")
-            status_label.setStyleSheet("color: #28a745; font-size: 8px; font-weight: bold;")
-            info_layout.addWidget(status_label)
-        
-        if self.app_data.get('required', False):
-            req_label = QLabel("[RECOMMENDED]")
-            req_label.setStyleSheet("color: #007bff; font-size: 8px; font-weight: bold;")
-            info_layout.addWidget(req_label)
-        
-        layout.addWidget(info_widget, 1)  # Give it stretch priority
-    
-    def load_app_icon(self):
-        """Load app icon with fallback options"""
-        app_id = self.app_data.get('id', '')
-        
-        # Try to find icon file
-        icon_paths_to_try = [
-            self.config.app_icons_dir / f"creative-suite-{app_id}.png",
-            self.config.app_icons_dir / f"{app_id}.png",
-            # Try your available icon sizes in order of preference
-            Path(f"/usr/share/icons/hicolor/32x32/apps/{app_id}.png"),
-            Path(f"/usr/share/icons/hicolor/48x48/apps/{app_id}.png"),
-            Path(f"/usr/share/icons/hicolor/24x24/apps/{app_id}.png"),
-            Path(f"/usr/share/pixmaps/{app_id}.png"),
-        ]
-        
-        for icon_path in icon_paths_to_try:
-            if icon_path.exists():
-                try:
-                    return QPixmap(str(icon_path))
-                except Exception as e:
-                    print(f"Warning: Could not load icon {icon_path}: {e}")
-                    continue
+        if installed:
+            lines.append(self._single_line(self._installed_style, "[CURRENTLY IN BUNDLE]"))
+        if app.get('required', False):
+            lines.append(self._single_line(self._required_style, "[RECOMMENDED]"))
+        
+        text_height = sum(line[2] for line in lines) + self.LINE_SPACING * (len(lines) - 1)
+        row_layout = self._row_layouts[key] = (lines, text_height)
+        return row_layout
+    
+    @staticmethod
+    def _single_line(style, text):
+        return style, text, style[2].height(), False
+    
+    def _content_rect(self, rect):
+        inset_x = self.OUTER_MARGIN + self.H_PADDING
+        inset_y = self.OUTER_MARGIN + self.V_PADDING
+        return rect.adjusted(inset_x, inset_y, -inset_x, -inset_y)
+    
+    def _check_rect(self, option):
+        style = option.widget.style() if option.widget else QApplication.style()
+        width = style.pixelMetric(QStyle.PM_IndicatorWidth)
+        height = style.pixelMetric(QStyle.PM_IndicatorHeight)
+        content = self._content_rect(option.rect)
+        return QRect(content.left(), content.center().y() - height // 2, width, height)
+    
+    def _text_width(self, option):
+        """Width left for the text column once the checkbox and icon are placed"""
+        style = option.widget.style() if option.widget else QApplication.style()
+        used = style.pixelMetric(QStyle.PM_IndicatorWidth) + 2 * self.SPACING + self.ICON_BOX
+        return max(0, self._content_rect(option.rect).width() - 1 - used)
+    
+    def sizeHint(self, option, index):
+        _, text_height = self._row_layout(index.data(APP_DATA_ROLE), index.data(INSTALLED_ROLE),
+                                          self._text_width(option))
+        content_height = max(self.ICON_BOX, text_height)
+        return QSize(option.rect.width(), content_height + 2 * (self.OUTER_MARGIN + self.V_PADDING))
+    
+    def paint(self, painter, option, index):
+        app = index.data(APP_DATA_ROLE)
+        style = option.widget.style() if option.widget else QApplication.style()
+        hovered = bool(option.state & QStyle.State_MouseOver)
         
-        return None
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        # Row frame
+        frame = option.rect.adjusted(self.OUTER_MARGIN, self.OUTER_MARGIN, -self.OUTER_MARGIN, -self.OUTER_MARGIN)
+        painter.setPen(QPen(self._hover_border if hovered else self._border, 1))
+        painter.setBrush(self._hover_background if hovered else self._background)
+        painter.drawRoundedRect(frame, 6, 6)
+        
+        # Checkbox
+        check_rect = self._check_rect(option)
+        check_option = QStyleOptionButton()
+        check_option.rect = check_rect
+        check_option.state = QStyle.State_Enabled
+        check_option.state |= QStyle.State_On if index.data(Qt.CheckStateRole) == Qt.Checked else QStyle.State_Off
+        style.drawControl(QStyle.CE_CheckBox, check_option, painter, option.widget)
+        
+        # Icon, centered in its container
+        content = self._content_rect(option.rect)
+        icon_box = QRect(check_rect.right() + 1 + self.SPACING, content.center().y() - self.ICON_BOX // 2,
+                         self.ICON_BOX, self.ICON_BOX)
+        pixmap = index.data(Qt.DecorationRole)
+        if not pixmap:
+            pixmap = _placeholder_pixmap(self.ICON_BOX)
+        painter.drawPixmap(icon_box.center().x() - pixmap.width() // 2,
+                           icon_box.center().y() - pixmap.height() // 2, pixmap)
+        
+        # App info, vertically centered next to the icon
+        text_left = icon_box.right() + 1 + self.SPACING
+        text_width = self._text_width(option)
+        lines, text_height = self._row_layout(app, index.data(INSTALLED_ROLE), text_width)
+        text_color = option.palette.color(QPalette.Text)
+        y = content.center().y() - text_height // 2
+        for (font, color, metrics), text, height, wrap in lines:
+            painter.setFont(font)
+            painter.setPen(color or text_color)
+            if wrap:
+                painter.drawText(QRect(text_left, y, text_width, height),
+                                 Qt.TextWordWrap | Qt.AlignLeft | Qt.AlignTop, text)
+            else:
+                painter.drawText(QRect(text_left, y, text_width, height), Qt.AlignLeft | Qt.AlignVCenter,
+                                 metrics.elidedText(text, Qt.ElideRight, text_width))
+            y += height + self.LINE_SPACING
+        
+        painter.restore()
+    
+    def editorEvent(self, event, model, option, index):
+        """Toggle the checkbox on click (on the indicator) or Space"""
+        if not (index.flags() & Qt.ItemIsUserCheckable):
+            return False
+        
+        if event.type() in (QEvent.MouseButtonPress, QEvent.MouseButtonDblClick):
+            return self._check_rect(option).contains(event.pos())
+        
+        if event.type() == QEvent.MouseButtonRelease:
+            if event.button() != Qt.LeftButton or not self._check_rect(option).contains(event.pos()):
+                return False
+        elif event.type() == QEvent.KeyPress:
+            if event.key() not in (Qt.Key_Space, Qt.Key_Select):
+                return False
+        else:
+            return False
+        
+        checked = index.data(Qt.CheckStateRole) == Qt.Checked
+        return model.setData(index, Qt.Unchecked if checked else Qt.Checked, Qt.CheckStateRole)
+
+class AppListView(QListView):
+    """Category list that shows every row; its height follows the wrapped row heights"""
     
-    def is_checked(self):
-        """Return checkbox state"""
-        return self.checkbox.isChecked()
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # Descriptions re-wrap at a new width, which changes the row heights
+        if event.size().width() != event.oldSize().width():
+            self.fit_to_rows()
     
-    def set_checked(self, checked):
-        """Set checkbox state"""
-        self.checkbox.setChecked(checked)
+    def fit_to_rows(self):
+        rows = self.model().rowCount() if self.model() else 0
+        self.setFixedHeight(sum(self.sizeHintForRow(row) for row in range(rows)) + 2 * self.frameWidth())
 
 class SelectionPage(BasePage):
     """Application selection page with PySide2"""
@@ -204,17 +448,34 @@ class SelectionPage(BasePage):
         # Add app_parser reference to config for bundle prefix detection
         self.config.app_parser = app_parser
         
-        # Initialize state detector
+        # Initialize state detector (imported here; it pulls in the availability detector)
+        from core.bundle_state_detector import BundleStateDetector
         self.state_detector = BundleStateDetector(config)
         
         # Get current bundle state
         self.bundle_info = self.state_detector.get_bundle_info_with_availability(app_parser)
         self.currently_installed = self.bundle_info["installed_app_ids"]
         
-        print(f"DEBUG: Bundle info: {self.bundle_info}")
+        logger.debug("Bundle info: %s", self.bundle_info)
         
-        self.app_widgets = {}  # Store widget references
+        # Suite info, fetched once for titles and dialogs
+        self._suite_info = app_parser.get_suite_info()
+        self._suite_name = self._suite_info.get('name', 'Application Bundle')
+        
+        # App definitions, fetched once: by category for layout, by id for lookups
+        self._apps_by_category = app_parser.get_apps_by_category()
+        self._app_by_id = {
+            app.get('id'): app
+            for apps in self._apps_by_category.values()
+            for app in apps
+        }
+        
+        self._installed_ids = frozenset(self.currently_installed)
+        self._app_models = []  # One AppListModel per category
+        self._selected_ids = set()  # Checked app ids, updated in place by the models
         self._removal_result = None  # For bundle removal
+        self._ui_ready = False  # Ignore selection signals until the page is built
+        self._summary_key = None  # Selection the summary label was last rendered for
         
         super().__init__(parent, config)
     
@@ -226,8 +487,7 @@ class SelectionPage(BasePage):
         main_layout.setSpacing(15)
         
         # Get suite info for dynamic titles
-        suite_info = self.app_parser.get_suite_info()
-        suite_name = suite_info.get('name', 'Application Bundle')
+        suite_name = self._suite_name
         
         # Dynamic title based on bundle state
         if self.bundle_info["is_installed"]:
@@ -239,10 +499,7 @@ class SelectionPage(BasePage):
         
         # Title
         title = QLabel(title_text)
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(_bold_font(16))
         title.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(title)
         
@@ -267,8 +524,8 @@ class SelectionPage(BasePage):
         self.create_summary_area(main_layout)
         
         # Update selection count initially
-        self.update_selection_count()
-        self.update_summary()
+        self._ui_ready = True
+        self.on_selection_changed()
     
     def show_current_state_info(self, layout):
         """Show information about current bundle installation"""
@@ -334,16 +591,18 @@ class SelectionPage(BasePage):
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         
-        # Content widget for scroll area
+        # Content widget for scroll area; built unparented and only handed to
+        # the scroll area once fully populated, so Qt lays it out in one pass
         content_widget = QWidget()
         content_layout = QVBoxLayout(content_widget)
         content_layout.setContentsMargins(10, 10, 10, 10)
         content_layout.setSpacing(15)
         
-        # Get apps organized by category
-        apps_by_category = self.app_parser.get_apps_by_category()
+        # Shared row painter for every category list
+        self._app_delegate = AppDelegate(content_widget)
         
-        for category, apps in apps_by_category.items():
+        # Get apps organized by category
+        for category, apps in self._apps_by_category.items():
             self.create_category_section(content_layout, category, apps)
         
         # Add stretch at the end
@@ -359,32 +618,38 @@ class SelectionPage(BasePage):
         category_layout = QVBoxLayout(category_box)
         category_layout.setSpacing(8)
         
-        # Create app entries for this category
+        # Pre-select currently installed apps, otherwise the definition's default
         for app in apps:
-            self.create_app_entry(category_layout, app)
+            if app.get('id') in self._installed_ids or app.get('default_selected', False):
+                self._selected_ids.add(app.get('id'))
+        
+        model = AppListModel(apps, self._selected_ids, self._installed_ids, self.config, category_box)
+        model.checkToggled.connect(self._on_one_changed)
+        self._app_models.append(model)
+        
+        # One painted list per category instead of a widget tree per app
+        view = AppListView()
+        view.setModel(model)
+        view.setItemDelegate(self._app_delegate)
+        view.setFrameShape(QFrame.NoFrame)
+        view.setSelectionMode(QAbstractItemView.NoSelection)
+        view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        view.setMouseTracking(True)
+        view.viewport().setAttribute(Qt.WA_Hover)
+        view.setStyleSheet(_LIST_QSS)
+        # Lay the rows out again on resize so their wrapped heights are current
+        view.setResizeMode(QListView.Adjust)
+        
+        # Show every row; the page's scroll area does the scrolling
+        view.fit_to_rows()
+        category_layout.addWidget(view)
         
         layout.addWidget(category_box)
     
-    def create_app_entry(self, layout, app):
-        """Create a single app entry widget"""
-        app_id = app.get('id')
-        is_currently_installed = app_id in self.currently_installed
-        
-        # Create app entry widget
-        app_widget = AppEntryWidget(app, is_currently_installed, self.config)
-        
-        # Connect checkbox change
-        app_widget.checkbox.stateChanged.connect(self.on_selection_changed)
-        
-        # Store the widget
-        self.app_widgets[app_id] = app_widget
-        
-        layout.addWidget(app_widget)
-    
     def create_summary_area(self, layout):
         """Create summary area showing what will be installed/changed"""
-        suite_info = self.app_parser.get_suite_info()
-        suite_name = suite_info.get('name', 'Application Bundle')
+        suite_name = self._suite_name
         
         if self.bundle_info["is_installed"]:
             summary_title = f"{suite_name} Changes Summary"
@@ -394,11 +659,20 @@ class SelectionPage(BasePage):
         summary_box = QGroupBox(summary_title)
         summary_layout = QVBoxLayout(summary_box)
         
-        self.summary_text = QTextEdit()
-        self.summary_text.setFixedHeight(100)
-        self.summary_text.setReadOnly(True)
+        # Plain QLabel in a fixed-height scroll area; no rich-text document to relayout
+        summary_scroll = QScrollArea()
+        summary_scroll.setFixedHeight(100)
+        summary_scroll.setWidgetResizable(True)
+        summary_scroll.setFrameShape(QFrame.NoFrame)
+        summary_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        
+        self.summary_text = QLabel()
+        self.summary_text.setWordWrap(True)
+        self.summary_text.setTextFormat(Qt.PlainText)
+        self.summary_text.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.summary_text.setAlignment(Qt.AlignTop | Qt.AlignLeft)
         self.summary_text.setStyleSheet("""
-            QTextEdit {
+            QLabel {
                 background-color: #f8f9fa;
                 border: 1px solid #e9ecef;
                 border-radius: 4px;
@@ -406,79 +680,85 @@ class SelectionPage(BasePage):
                 font-size: 10px;
             }
         """)
-        summary_layout.addWidget(self.summary_text)
+        summary_scroll.setWidget(self.summary_text)
+        summary_layout.addWidget(summary_scroll)
         
         layout.addWidget(summary_box)
     
+    def _bulk_set(self, predicate):
+        """Check every app matching predicate(app), refreshing the page once"""
+        for model in self._app_models:
+            model.set_checked_where(predicate)
+        self.on_selection_changed()
+    
     def select_all(self):
         """Select all applications"""
-        for app_widget in self.app_widgets.values():
-            app_widget.set_checked(True)
-        self.on_selection_changed()
+        self._bulk_set(lambda app: True)
     
     def select_none(self):
         """Deselect all applications"""
-        for app_widget in self.app_widgets.values():
-            app_widget.set_checked(False)
-        self.on_selection_changed()
+        self._bulk_set(lambda app: False)
     
     def select_recommended(self):
         """Select recommended applications and currently installed"""
-        for app_id, app_widget in self.app_widgets.items():
-            app_data = app_widget.app_data
-            is_currently_installed = app_widget.is_currently_installed
-            
-            # Select if recommended OR currently installed
-            if app_data.get('default_selected', False) or is_currently_installed:
-                app_widget.set_checked(True)
-            else:
-                app_widget.set_checked(False)
+        self._bulk_set(
+            lambda app: app.get('default_selected', False) or app.get('id') in self._installed_ids
+        )
+    
+    def _on_one_changed(self, app_id, checked):
+        """A single app was toggled (the model already updated _selected_ids)"""
         self.on_selection_changed()
     
     def on_selection_changed(self):
         """Called when selection changes"""
+        if not self._ui_ready:
+            return
         self.update_selection_count()
         self.update_summary()
     
     def update_selection_count(self):
         """Update the selection count label"""
-        selected_count = sum(1 for widget in self.app_widgets.values() if widget.is_checked())
-        total_count = len(self.app_widgets)
-        
-        self.selection_count_label.setText(f"Selected: {selected_count}/{total_count}")
+        self.selection_count_label.setText(f"Selected: {len(self._selected_ids)}/{len(self._app_by_id)}")
     
     def update_summary(self):
         """Update the installation/changes summary"""
-        selected_apps = self.get_selected_apps()
-        selected_ids = [app.get('id') for app in selected_apps]
-        
-        # Calculate changes if bundle is installed
+        # Skip rebuilding the text when the selection is unchanged
+        summary_key = frozenset(self._selected_ids)
+        if summary_key == self._summary_key:
+            return
+        self._summary_key = summary_key
+        
+        # Calculate changes if bundle is installed, diffing against the
+        # installed set captured with bundle_info
         if self.bundle_info["is_installed"]:
-            changes = self.state_detector.get_installation_changes(selected_ids)
+            to_add = summary_key - self._installed_ids
+            to_remove = self._installed_ids - summary_key
+            no_change = self._installed_ids & summary_key
             
-            if not changes["has_changes"]:
+            if not to_add and not to_remove:
                 summary_text = "No changes - selection matches current installation."
             else:
                 summary_lines = []
                 
-                if changes["to_add"]:
-                    summary_lines.append(f"Install {len(changes['to_add'])} new applications:")
-                    for app_id in changes["to_add"]:
-                        app_name = self.app_parser.get_app_field(app_id, 'name') or app_id
+                if to_add:
+                    summary_lines.append(f"Install {len(to_add)} new applications:")
+                    for app_id in sorted(to_add):
+                        app_name = self._app_by_id.get(app_id, {}).get('name') or app_id
                         summary_lines.append(f"  + {app_name}")
                 
-                if changes["to_remove"]:
-                    summary_lines.append(f"Remove {len(changes['to_remove'])} from bundle:")
-                    for app_id in changes["to_remove"]:
-                        app_name = self.app_parser.get_app_field(app_id, 'name') or app_id
+                if to_remove:
+                    summary_lines.append(f"Remove {len(to_remove)} from bundle:")
+                    for app_id in sorted(to_remove):
+                        app_name = self._app_by_id.get(app_id, {}).get('name') or app_id
                         summary_lines.append(f"  - {app_name}")
                 
-                if changes["no_change"]:
-                    summary_lines.append(f"Keep {len(changes['no_change'])} current applications")
+                if no_change:
+                    summary_lines.append(f"Keep {len(no_change)} current applications")
                 
                 summary_text = "\n".join(summary_lines)
         else:
             # Fresh installation
+            selected_apps = self.get_selected_apps()
             if not selected_apps:
                 summary_text = "No applications selected."
             else:
@@ -493,23 +773,16 @@ class SelectionPage(BasePage):
                 
                 summary_text = "\n".join(summary_lines)
         
-        # Update text widget
-        self.summary_text.setPlainText(summary_text)
+        # Update summary label
+        self.summary_text.setText(summary_text)
     
     def get_selected_apps(self):
         """Get list of selected applications"""
-        selected_apps = []
-        
-        for app_id, app_widget in self.app_widgets.items():
-            if app_widget.is_checked():
-                selected_apps.append(app_widget.app_data)
-        
-        return selected_apps
+        return [app for app_id, app in self._app_by_id.items() if app_id in self._selected_ids]
     
     def confirm_remove_bundle(self):
         """Confirm and initiate complete bundle removal"""
-        suite_info = self.app_parser.get_suite_info()
-        suite_name = suite_info.get('name', 'Application Bundle')
+        suite_name = self._suite_name
         
         # Get list of currently installed apps for confirmation
         app_names = self.bundle_info["installed_app_names"]
@@ -552,13 +825,12 @@ Continue with {suite_name} removal?"""
                 'app_names': self.bundle_info["installed_app_names"]
             }
             
-            print("DEBUG: Bundle removal confirmed, will be processed in on_next()")
+            logger.debug("Bundle removal confirmed, will be processed in on_next()")
     
     def validate_selection(self):
         """Validate that selection is acceptable"""
         selected_apps = self.get_selected_apps()
-        suite_info = self.app_parser.get_suite_info()
-        suite_name = suite_info.get('name', 'Application Bundle')
+        suite_name = self._suite_name
         
         if not selected_apps:
             # Check if this is removing everything from an existing bundle
@@ -587,7 +859,7 @@ Continue with {suite_name} removal?"""
         if self._removal_result:
             result = self._removal_result
             self._removal_result = None  # Clean up
-            print("DEBUG: Returning removal result from on_next()")
+            logger.debug("Returning removal result from on_next()")
             return result
         
         if not self.validate_selection():
@@ -616,8 +888,7 @@ Continue with {suite_name} removal?"""
             }
         else:
             # Fresh installation
-            suite_info = self.app_parser.get_suite_info()
-            suite_name = suite_info.get('name', 'Application Bundle')
+            suite_name = self._suite_name
             
             # Confirm installation
             app_names = [app.get('name', 'Unknown') for app in selected_apps]
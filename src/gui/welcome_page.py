@@ -10,8 +10,9 @@ Created: 2025-06-01
 Ported to PySide2: 2025-07-12
 """
 
+import functools
 from pathlib import Path
-from PySide2.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
+from PySide2.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
 from PySide2.QtCore import Qt
 from PySide2.QtGui import QFont, QPixmap
 from gui.base_page import BasePage
@@ -19,6 +20,31 @@ from gui.base_page import BasePage
 # Loading Screen Solutions logo image
 LSS_LOGO_PATH = Path(__file__).parent.parent.parent / "assets" / "icons" / "suite-icons" / "lss-logo-transparent-bg.png"
 
+_INFO_QSS = """
+    QLabel {
+        font-size: 11px;
+        line-height: 1.4;
+        padding: 20px;
+        background-color: #f8f9fa;
+        border: 1px solid #e9ecef;
+        border-radius: 6px;
+    }
+"""
+
+@functools.lru_cache(maxsize=None)
+def _bold_font(point_size):
+    """Shared bold QFont of the given point size"""
+    font = QFont()
+    font.setBold(True)
+    font.setPointSize(point_size)
+    return font
+
+@functools.lru_cache(maxsize=None)
+def _scaled_logo():
+    """LSS logo scaled to a reasonable size, decoded once per process"""
+    logo_pixmap = QPixmap(str(LSS_LOGO_PATH))
+    return logo_pixmap.scaled(60, 40, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
 class WelcomePage(BasePage):
     def __init__(self, parent, suite_info, all_apps, config):
         self.suite_info = suite_info
@@ -33,18 +59,12 @@ class WelcomePage(BasePage):
         
         # Welcome content
         title = QLabel("Linux Creative Suite")
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(_bold_font(18))
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
         
         description = QLabel("Open source alternatives to Adobe Creative Suite")
-        desc_font = QFont()
-        desc_font.setPointSize(12)
-        desc_font.setBold(True)
-        description.setFont(desc_font)
+        description.setFont(_bold_font(12))
         description.setAlignment(Qt.AlignCenter)
         description.setStyleSheet("color: #666666; margin-bottom: 10px;")
         layout.addWidget(description)
@@ -65,16 +85,7 @@ Click 'Get Started' to begin selecting applications."""
         info_label = QLabel(info_text)
         info_label.setWordWrap(True)
         info_label.setAlignment(Qt.AlignLeft)
-        info_label.setStyleSheet("""
-            QLabel {
-                font-size: 11px;
-                line-height: 1.4;
-                padding: 20px;
-                background-color: #f8f9fa;
-                border: 1px solid #e9ecef;
-                border-radius: 6px;
-            }
-        """)
+        info_label.setStyleSheet(_INFO_QSS)
         layout.addWidget(info_label, 1)  # Give it stretch priority
         
         # Add LSS credits section at the bottom
@@ -82,56 +93,54 @@ Click 'Get Started' to begin selecting applications."""
     
     def create_credits_section(self, layout):
         """Create the Loading Screen Solutions credits section"""
-        try:
-            if LSS_LOGO_PATH.exists():
-                # Credits frame
-                credits_frame = QWidget()
-                credits_layout = QHBoxLayout(credits_frame)
-                credits_layout.setContentsMargins(0, 30, 0, 20)
-                
-                # Logo label
-                logo_label = QLabel()
-                logo_pixmap = QPixmap(str(LSS_LOGO_PATH))
-                # Scale the logo to a reasonable size
-                scaled_pixmap = logo_pixmap.scaled(60, 40, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                logo_label.setPixmap(scaled_pixmap)
-                credits_layout.addWidget(logo_label)
-                
-                # Credits text
-                credits_text = """Developed by
+        if not LSS_LOGO_PATH.exists():
+            self._add_text_only_credits(layout)
+            return
+        
+        # Credits frame
+        credits_frame = QWidget()
+        credits_layout = QHBoxLayout(credits_frame)
+        credits_layout.setContentsMargins(0, 30, 0, 20)
+        
+        # Logo label
+        logo_label = QLabel()
+        logo_label.setPixmap(_scaled_logo())
+        credits_layout.addWidget(logo_label)
+        
+        # Credits text
+        credits_text = """Developed by
 Loading Screen Solutions
 Technology consulting & liberation"""
-                
-                credits_label = QLabel(credits_text)
-                credits_label.setStyleSheet("""
-                    QLabel {
-                        color: #666666;
-                        font-size: 9px;
-                        margin-left: 10px;
-                    }
-                """)
-                credits_layout.addWidget(credits_label)
-                
-                # Add stretch to center the credits
-                credits_layout.addStretch()
-                
-                layout.addWidget(credits_frame)
-                
-        except Exception as e:
-            print(f"Could not load LSS logo: {e}")
-            # Fallback to text-only credits
-            credits_text = """Developed by Loading Screen Solutions
+        
+        credits_label = QLabel(credits_text)
+        credits_label.setStyleSheet("""
+            QLabel {
+                color: #666666;
+                font-size: 9px;
+                margin-left: 10px;
+            }
+        """)
+        credits_layout.addWidget(credits_label)
+        
+        # Add stretch to center the credits
+        credits_layout.addStretch()
+        
+        layout.addWidget(credits_frame)
+    
+    def _add_text_only_credits(self, layout):
+        """Fallback credits when the logo image is missing"""
+        credits_text = """Developed by Loading Screen Solutions
 Technology consulting & liberation"""
-            
-            credits_label = QLabel(credits_text)
-            credits_label.setAlignment(Qt.AlignCenter)
-            credits_label.setStyleSheet("""
-                QLabel {
-                    color: #666666;
-                    font-size: 9px;
-                    font-style: italic;
-                    margin-top: 30px;
-                    margin-bottom: 20px;
-                }
-            """)
-            layout.addWidget(credits_label)
+        
+        credits_label = QLabel(credits_text)
+        credits_label.setAlignment(Qt.AlignCenter)
+        credits_label.setStyleSheet("""
+            QLabel {
+                color: #666666;
+                font-size: 9px;
+                font-style: italic;
+                margin-top: 30px;
+                margin-bottom: 20px;
+            }
+        """)
+        layout.addWidget(credits_label)
@@ -45,29 +45,20 @@ src_dir = os.path.dirname(os.path.abspath(__file__))
 if src_dir not in sys.path:
     sys.path.insert(0, src_dir)
 
-# PySide2 imports
-from PySide2.QtWidgets import QApplication, QMessageBox
-from PySide2.QtCore import Qt
-from PySide2.QtGui import QIcon
-
-# Now we can use absolute imports
-from gui.main_window import MainWindow
-from core.config import Config
+# PySide2 and the GUI modules are imported inside the functions below, so
+# the requirement checks can fail fast without loading Qt
 
 def check_requirements():
     """Check if we're running with appropriate permissions and dependencies"""
-    # Check if we're running as root (we shouldn't be)
+    # Check if we're running as root (we shouldn't be). Checked first and
+    # reported on the terminal, so no Qt application is created as root
     if os.geteuid() == 0:
-        QMessageBox.critical(
-            None,
-            "Error", 
-            "Please do not run this installer as root.\n"
-            "The installer will request sudo permissions when needed."
-        )
+        print("Error: Please do not run this installer as root.")
+        print("The installer will request sudo permissions when needed.")
         return False
     
     # Check if we have a display environment
-    if not os.environ.get('DISPLAY') and not os.environ.get('WAYLAND_DISPLAY'):
+    if not ({'DISPLAY', 'WAYLAND_DISPLAY'} & os.environ.keys()):
         print("Error: No display environment detected.")
         print("This installer requires a graphical desktop environment.")
         return False
@@ -76,6 +67,10 @@ def check_requirements():
 
 def setup_application():
     """Set up the QApplication with proper settings"""
+    from PySide2.QtWidgets import QApplication
+    from PySide2.QtCore import Qt, QResource
+    from PySide2.QtGui import QIcon, QPixmapCache
+    
     # Enable high DPI support
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
@@ -86,9 +81,17 @@ def setup_application():
     app.setApplicationVersion("1.0")
     app.setOrganizationName("Loading Screen Solutions")
     
+    # Room for every suite icon (full size and scaled) in the shared pixmap cache
+    QPixmapCache.setCacheLimit(10240)  # KB
+    
+    # Register pre-scaled app icons baked in by the AppImage build, if present
+    from pathlib import Path
+    icons_rcc = Path(__file__).parent.parent / "assets" / "icons.rcc"
+    if icons_rcc.exists() and not QResource.registerResource(str(icons_rcc)):
+        print(f"Warning: Could not register icon resources: {icons_rcc}")
+    
     # Set application icon if available
     try:
-        from pathlib import Path
         icon_path = Path(__file__).parent.parent / "assets" / "icons" / "suite-icons" / "lss-logo.png"
         if icon_path.exists():
             app.setWindowIcon(QIcon(str(icon_path)))
@@ -104,15 +107,22 @@ def main():
         if not check_requirements():
             sys.exit(1)
         
+        # Now we can use absolute imports
+        from PySide2.QtCore import QTimer
+        from gui.main_window import MainWindow
+        from core.config import Config
+        
         # Initialize configuration
         config = Config()
         
         # Set up the Qt application
         app = setup_application()
         
-        # Create and show the main window
+        # Create and show the main window, then load definitions and the
+        # first page once the event loop is running
         main_window = MainWindow(config)
         main_window.show()
+        QTimer.singleShot(0, main_window.deferred_init)
         
         # Start the event loop
         return app.exec_()
@@ -125,6 +135,8 @@ def main():
         error_msg = f"An unexpected error occurred:\n\n{str(e)}\n\nTraceback:\n{traceback.format_exc()}"
         
         try:
+            from PySide2.QtWidgets import QApplication, QMessageBox
+            
             # Try to create a minimal QApplication for the error dialog
             if not QApplication.instance():
                 error_app = QApplication(sys.argv)
@@ -137,4 +149,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
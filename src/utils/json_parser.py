@@ -36,28 +36,64 @@ JSON parsing utilities for app definitions
 Adapted from the bash script logic
 """
 
+import os
 import json
+import mmap
 import shutil
+import functools
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+# Optional C-accelerated JSON parser; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Files at least this large are parsed straight from an mmap instead of read() into a copy
+MMAP_THRESHOLD = 16 * 1024
+
 class AppDefinitionParser:
     """Parser for app_definitions.json file"""
     
+    __slots__ = ('json_file_path', 'data', '_apps_by_id', '_app_ids', '_valid', '_apps_by_category')
+    
     def __init__(self, json_file_path: Path):
         self.json_file_path = json_file_path
         self.data = None
+        self._apps_by_id = {}
+        self._app_ids = []
+        self._valid = None  # validate_json_structure() result, computed once
+        self._apps_by_category = None  # get_apps_by_category() result, built once
         self._load_json()
     
     def _load_json(self):
         """Load and parse the JSON file"""
         try:
-            with open(self.json_file_path, 'r', encoding='utf-8') as f:
-                self.data = json.load(f)
+            if orjson is not None:
+                with open(self.json_file_path, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                            self.data = orjson.loads(view)
+                    else:
+                        self.data = orjson.loads(f.read())
+            else:
+                with open(self.json_file_path, 'r', encoding='utf-8') as f:
+                    self.data = json.load(f)
         except FileNotFoundError:
             raise FileNotFoundError(f"App definitions file not found: {self.json_file_path}")
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # json.JSONDecodeError and orjson.JSONDecodeError are both ValueErrors
             raise ValueError(f"Invalid JSON in app definitions file: {e}")
+        
+        # Index apps by id once; the first definition of an id wins, as with a linear scan
+        apps = self.data.get('apps', []) if isinstance(self.data, dict) else []
+        for app in apps:
+            app_id = app.get('id') if isinstance(app, dict) else None
+            if app_id:
+                self._apps_by_id.setdefault(app_id, app)
+                self._app_ids.append(app_id)
     
     def get_suite_info(self) -> Dict[str, str]:
         """Get general suite information"""
@@ -69,10 +105,7 @@ class AppDefinitionParser:
     
     def get_app_by_id(self, app_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific app by its ID"""
-        for app in self.get_all_apps():
-            if app.get('id') == app_id:
-                return app
-        return None
+        return self._apps_by_id.get(app_id)
     
     def get_app_field(self, app_id: str, field: str) -> Optional[Any]:
         """Get a specific field from an app (equivalent to bash get_app_field function)"""
@@ -83,17 +116,16 @@ class AppDefinitionParser:
     
     def get_all_app_ids(self) -> List[str]:
         """Get list of all app IDs"""
-        return [app.get('id') for app in self.get_all_apps() if app.get('id')]
+        return list(self._app_ids)
     
     def get_apps_by_category(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Group apps by category"""
-        categories = {}
-        for app in self.get_all_apps():
-            category = app.get('category', 'Other')
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(app)
-        return categories
+        """Group apps by category (built once; treat the result as read-only)"""
+        if self._apps_by_category is None:
+            categories = defaultdict(list)
+            for app in self.get_all_apps():
+                categories[app.get('category', 'Other')].append(app)
+            self._apps_by_category = dict(categories)
+        return self._apps_by_category
     
     def get_required_apps(self) -> List[Dict[str, Any]]:
         """Get list of required applications"""
@@ -129,6 +161,12 @@ class AppDefinitionParser:
     
     def validate_json_structure(self) -> bool:
         """Validate that the JSON has the expected structure"""
+        # self.data doesn't change after loading, so validate only once
+        if self._valid is None:
+            self._valid = self._validate()
+        return self._valid
+    
+    def _validate(self) -> bool:
         if not isinstance(self.data, dict):
             return False
         
@@ -148,11 +186,11 @@ class AppDefinitionParser:
             return False
         
         # Check each app has required fields
-        required_app_fields = ['id', 'name', 'description', 'category']
+        required_app_fields = {'id', 'name', 'description', 'category'}
         for app in apps:
             if not isinstance(app, dict):
                 return False
-            if not all(field in app for field in required_app_fields):
+            if not required_app_fields <= app.keys():
                 return False
         
         return True
@@ -160,22 +198,33 @@ class AppDefinitionParser:
     def copy_to_user_location(self, destination_path: Path):
         """Copy the JSON file to user's data directory"""
         try:
-            shutil.copy2(self.json_file_path, destination_path)
+            shutil.copyfile(self.json_file_path, destination_path)
             return True
         except Exception as e:
             print(f"Error copying JSON file: {e}")
             return False
 
+@functools.lru_cache(maxsize=32)
+def _get_cached_parser(path_str: str, mtime_ns: int) -> AppDefinitionParser:
+    """Shared parser per file version; a changed mtime gives a fresh parse"""
+    return AppDefinitionParser(Path(path_str))
+
+def _parser_for(json_file_path: Path) -> AppDefinitionParser:
+    """Cached parser for json_file_path, reparsed only when the file changes"""
+    try:
+        mtime_ns = Path(json_file_path).stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"App definitions file not found: {json_file_path}")
+    return _get_cached_parser(str(json_file_path), mtime_ns)
+
 # Convenience functions for backwards compatibility with bash script logic
 def get_app_field(json_file_path: Path, app_id: str, field: str) -> Optional[Any]:
     """Standalone function equivalent to bash get_app_field"""
-    parser = AppDefinitionParser(json_file_path)
-    return parser.get_app_field(app_id, field)
+    return _parser_for(json_file_path).get_app_field(app_id, field)
 
 def get_all_app_ids(json_file_path: Path) -> List[str]:
     """Standalone function equivalent to bash get_all_app_ids"""
-    parser = AppDefinitionParser(json_file_path)
-    return parser.get_all_app_ids()
+    return _parser_for(json_file_path).get_all_app_ids()
 
 # Utility function to check if jq equivalent functionality is available
 def has_json_support() -> bool: